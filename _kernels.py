@@ -0,0 +1,204 @@
+"""
+Numeric kernels for the interference calculator.
+
+Numba is optional: when it is installed the victim scan is JIT-compiled and runs in
+parallel over products, otherwise the NumPy implementation is used.
+"""
+import numpy as np
+
+# Import numba with fallback for deployments without a JIT
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many product × victim pairs the NumPy search beats dispatching to the JIT kernel
+NUMBA_MIN_WORK = 200_000
+# Below this many rows the serial risk kernel beats starting the parallel one
+NUMBA_PARALLEL_MIN_ROWS = 50_000
+# Upper edges (MHz, exclusive) of the High / Med / Low proximity bins of risk_level
+RISK_DISTANCE_BINS = np.array([1.0, 5.0, 20.0])
+
+
+def _sorted_windows(freq: np.ndarray, rx_low: np.ndarray, rx_high: np.ndarray):
+    """
+    Sort the Rx windows by rx_low and bound, per frequency, the slice of sorted windows
+    that can contain it: windows from `last` on start above the frequency, windows
+    before `first` (prefix maximum of rx_high) all end below it.
+    """
+    order = np.argsort(rx_low, kind='stable')
+    low_sorted = rx_low[order]
+    high_sorted = rx_high[order]
+    reach = np.maximum.accumulate(high_sorted) if order.size else high_sorted
+    first = np.searchsorted(reach, freq, side='left')
+    last = np.searchsorted(low_sorted, freq, side='right')
+    return order, high_sorted, first, np.maximum(last, first)
+
+
+def _victim_hits_numpy(freq: np.ndarray, rx_low: np.ndarray, rx_high: np.ndarray):
+    order, high_sorted, first, last = _sorted_windows(freq, rx_low, rx_high)
+    span = last - first
+    rows = np.repeat(np.arange(freq.size), span)
+    # Sorted window index of every candidate: its row's first window plus its position
+    # within the row, built with one repeat and an in-place add instead of temporaries
+    k = np.repeat(first - (np.cumsum(span) - span), span)
+    k += np.arange(k.size)
+    hit = high_sorted[k] >= freq[rows]
+    rows, victims = rows[hit], order[k[hit]]
+    # Row-major with ascending victims, as a full product × victim scan would produce
+    row_major = np.lexsort((victims, rows))
+    safe = np.bincount(rows, minlength=freq.size) < rx_low.size
+    return rows[row_major], victims[row_major], safe
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _victim_hits_numba(freq, order, high_sorted, first, last, n_rx):
+        n_freq = freq.shape[0]
+        # Pass 1: count hits per product so every thread knows where to write in pass 2
+        counts = np.zeros(n_freq, dtype=np.int64)
+        for p in prange(n_freq):
+            f = freq[p]
+            c = 0
+            for k in range(first[p], last[p]):  # only windows that can contain f
+                if high_sorted[k] >= f:
+                    c += 1
+            counts[p] = c
+        offsets = np.zeros(n_freq + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts)
+        rows = np.empty(offsets[n_freq], dtype=np.int64)
+        victims = np.empty(offsets[n_freq], dtype=np.int64)
+        safe = np.empty(n_freq, dtype=np.bool_)
+        # Pass 2: fill the (product, victim) pairs, victims ascending within a product
+        for p in prange(n_freq):
+            f = freq[p]
+            start = offsets[p]
+            w = start
+            for k in range(first[p], last[p]):
+                if high_sorted[k] >= f:
+                    rows[w] = p
+                    victims[w] = order[k]
+                    w += 1
+            victims[start:w] = np.sort(victims[start:w])
+            safe[p] = counts[p] < n_rx
+        return rows, victims, safe
+
+
+def victim_hits(freq, rx_low, rx_high):
+    """
+    Test product frequencies against every victim Rx window.
+    Returns (rows, victims, safe): the (product, victim) index pairs of all hits in
+    row-major order, and a mask of the products that miss at least one victim.
+    The windows are searched in rx_low order, so disjoint bands cost O(log n) per product.
+    Integer (fixed-point) inputs are compared as integers; anything else as float64.
+    """
+    dtype = np.result_type(freq, rx_low, rx_high)
+    if not np.issubdtype(dtype, np.integer):
+        dtype = np.float64
+    freq = np.ascontiguousarray(freq, dtype=dtype)
+    rx_low = np.ascontiguousarray(rx_low, dtype=dtype)
+    rx_high = np.ascontiguousarray(rx_high, dtype=dtype)
+    if NUMBA_AVAILABLE and freq.size * rx_low.size >= NUMBA_MIN_WORK:
+        order, high_sorted, first, last = _sorted_windows(freq, rx_low, rx_high)
+        return _victim_hits_numba(freq, order, high_sorted, first, last, rx_low.size)
+    return _victim_hits_numpy(freq, rx_low, rx_high)
+
+
+def _jit(func):
+    """Compile a scalar kernel with numba when it is available, else run it as Python."""
+    return njit(cache=True)(func) if NUMBA_AVAILABLE else func
+
+
+@_jit
+def severity_level(ble_window, victim_level, victim_is_ble, type_modifier, multi_aggressor,
+                   public_safety_aggressor, wifi_aggressor, crit_severity, crit_gnss):
+    """
+    Integer core of the risk severity assessment (1-5, 5 = most critical). String checks
+    on band codes are resolved by the caller into the victim/aggressor flags, and the
+    frequency into its critical band severity (0 outside all critical bands), GNSS flag
+    and whether it lies in the 2.4 GHz BLE/Wi-Fi window.
+    """
+    severity = max(1, victim_level, crit_severity)
+    if crit_gnss:  # GPS interference is always critical
+        severity = 5
+    # Product type modifier: strong products +1, higher-order products -1
+    if type_modifier > 0:
+        severity = min(severity + 1, 5)
+    elif type_modifier < 0:
+        severity = max(severity - 1, 1)
+    if multi_aggressor:
+        severity = min(severity + 1, 5)
+    if public_safety_aggressor:
+        severity = min(severity + 1, 5)
+    if victim_is_ble and wifi_aggressor and ble_window:
+        severity = 5
+    return severity
+
+
+@_jit
+def severity_levels(ble_window, victim_level, victim_is_ble, type_modifier, multi_aggressor,
+                    public_safety_aggressor, wifi_aggressor, crit_severity, crit_gnss):
+    """Batch version of severity_level over row arrays."""
+    out = np.empty(ble_window.shape[0], dtype=np.int64)
+    for r in range(ble_window.shape[0]):
+        out[r] = severity_level(ble_window[r], victim_level[r], victim_is_ble[r], type_modifier[r],
+                                multi_aggressor[r], public_safety_aggressor[r], wifi_aggressor[r],
+                                crit_severity[r], crit_gnss[r])
+    return out
+
+
+@_jit
+def risk_level_code(freq_low, freq_high, rx_low, rx_high):
+    """Scalar risk_level as a code: 0/1 = High (in band / within 1 MHz), 2 = Med, 3 = Low, 4 = Minimal."""
+    if rx_low <= freq_low <= rx_high or rx_low <= freq_high <= rx_high:
+        return 0
+    if freq_low == freq_high and rx_low <= rx_high:
+        # Discrete product outside the window: the nearest edge is on its side, and the
+        # distance to it is the one positive difference (branchless max, no compare-select)
+        min_distance = max(rx_low - freq_low, freq_low - rx_high)
+    else:
+        min_distance = min(abs(freq_low - rx_low), abs(freq_low - rx_high),
+                           abs(freq_high - rx_low), abs(freq_high - rx_high))
+    code = 1
+    for edge in RISK_DISTANCE_BINS:
+        if min_distance < edge:
+            return code
+        code += 1
+    return code
+
+
+@_jit
+def _evaluate_row(fl, fh, lo, hi):
+    """Rx hit flag (hits_rx) and risk level code of one (freq_low, freq_high) row."""
+    risk = (lo <= fl <= hi) or (lo <= fh <= hi) or (fl <= lo and fh >= hi)
+    return risk, risk_level_code(fl, fh, lo, hi)
+
+
+@_jit
+def _evaluate_risks_serial(freq_low, freq_high, rx_low, rx_high):
+    n_rows = freq_low.shape[0]
+    risks = np.empty(n_rows, dtype=np.bool_)
+    levels = np.empty(n_rows, dtype=np.int64)
+    for r in range(n_rows):
+        risks[r], levels[r] = _evaluate_row(freq_low[r], freq_high[r], rx_low[r], rx_high[r])
+    return risks, levels
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _evaluate_risks_parallel(freq_low, freq_high, rx_low, rx_high):
+        # Rows (and so band pairs) are independent: every thread writes its own slots
+        n_rows = freq_low.shape[0]
+        risks = np.empty(n_rows, dtype=np.bool_)
+        levels = np.empty(n_rows, dtype=np.int64)
+        for r in prange(n_rows):
+            risks[r], levels[r] = _evaluate_row(freq_low[r], freq_high[r], rx_low[r], rx_high[r])
+        return risks, levels
+
+
+def evaluate_risks(freq_low, freq_high, rx_low, rx_high):
+    """Rx hit flag (hits_rx) and risk level code of every (freq_low, freq_high) row against its Rx window."""
+    if NUMBA_AVAILABLE and freq_low.shape[0] >= NUMBA_PARALLEL_MIN_ROWS:
+        return _evaluate_risks_parallel(freq_low, freq_high, rx_low, rx_high)
+    return _evaluate_risks_serial(freq_low, freq_high, rx_low, rx_high)
@@ -1,9 +1,14 @@
 from dataclasses import dataclass
 from typing import List
 
+import numpy as np
+
 
 @dataclass
 class Band:
+    # Fixed attribute set: no per-instance __dict__, smaller bands and faster field reads
+    __slots__ = ("code", "tx_low", "tx_high", "rx_low", "rx_high", "label", "category")
+
     code: str
     tx_low: float
     tx_high: float
@@ -12,6 +17,40 @@ class Band:
     label: str
     category: str
 
+
+@dataclass
+class BandArrays:
+    """Structure-of-arrays view of a band list: (n, 2) float64 [low, high] edge arrays."""
+    codes: List[str]
+    tx: np.ndarray
+    rx: np.ndarray
+
+    @property
+    def tx_low(self) -> np.ndarray:
+        return self.tx[:, 0]
+
+    @property
+    def tx_high(self) -> np.ndarray:
+        return self.tx[:, 1]
+
+    @property
+    def rx_low(self) -> np.ndarray:
+        return self.rx[:, 0]
+
+    @property
+    def rx_high(self) -> np.ndarray:
+        return self.rx[:, 1]
+
+
+def bands_to_soa(bands: List[Band]) -> BandArrays:
+    """Pull the band edges out of the Band objects once, for the vectorized kernels."""
+    n = len(bands)
+    return BandArrays(
+        codes=[b.code for b in bands],
+        tx=np.array([(b.tx_low, b.tx_high) for b in bands], dtype=np.float64).reshape(n, 2),
+        rx=np.array([(b.rx_low, b.rx_high) for b in bands], dtype=np.float64).reshape(n, 2),
+    )
+
 # LTE and ISM bands (extend as needed)
 # To add new bands, follow the format:
 # Band("BAND_CODE", tx_low, tx_high, rx_low, rx_high, "Band Label", "Category")
@@ -1,513 +1,428 @@
-from typing import List, Tuple, Dict
-from bands import Band
+import re
+from functools import lru_cache
+from typing import List, Tuple, Dict, NamedTuple, Optional
+import numpy as np
+from bands import Band, bands_to_soa
+from _kernels import (NUMBA_AVAILABLE, RISK_DISTANCE_BINS, victim_hits, severity_level, severity_levels,
+                      evaluate_risks, risk_level_code)
 
-def calculate_all_products(selected_bands: List[Band], guard: float = 0.0, imd2: bool = True, imd4: bool = False, imd5: bool = True, imd7: bool = False, aclr_margin: float = 0.0) -> Tuple[List[Dict], List[str]]:
+
+# Product types, indexed by the type codes stored in the columnar product buffers
+PRODUCT_TYPES = ("2H", "3H", "4H", "5H", "IM2", "IM3", "IM4", "IM5", "IM7", "ACLR")
+
+# Sort priority by typical signal level (lower number = higher signal level)
+SIGNAL_LEVEL_PRIORITY = {
+    '2H': 1,    # 2nd harmonic - typically highest
+    'IM2': 2,   # IM2 beat terms - often higher than IM3
+    '3H': 3,    # 3rd harmonic
+    'IM3': 4,   # IM3 - most common analysis
+    '4H': 5,    # 4th harmonic
+    'IM4': 6,   # IM4
+    '5H': 7,    # 5th harmonic
+    'IM5': 8,   # IM5
+    'IM7': 9,   # IM7 - lowest typical signal level
+    'ACLR': 10, # ACLR - different mechanism
+}
+
+# Product families: (name, Type, IM3_Type, Formula template, Details template).
+# Templates are only rendered for rows that survive deduplication. {ic}/{jc} are the
+# codes of the first/second band of the pair, {il}/{jl} the edge labels, {iv}/{jv}
+# the edge values, {op} the sign and {f} the product frequency.
+_PRODUCT_FAMILIES = (
+    ("2H", "2H", "Harmonic", "2×Tx_{il}({ic})", "2th Harmonic: 2×{iv} = {f:.1f} MHz (Band: {ic})"),
+    ("3H", "3H", "Harmonic", "3×Tx_{il}({ic})", "3th Harmonic: 3×{iv} = {f:.1f} MHz (Band: {ic})"),
+    ("4H", "4H", "Harmonic", "4×Tx_{il}({ic})", "4th Harmonic: 4×{iv} = {f:.1f} MHz (Band: {ic})"),
+    ("5H", "5H", "Harmonic", "5×Tx_{il}({ic})", "5th Harmonic: 5×{iv} = {f:.1f} MHz (Band: {ic})"),
+    ("IM2_sum", "IM2", "Beat Frequency", "{ic}_{il} + {jc}_{jl}",
+     "IM2 Beat: {iv} + {jv} = {f:.1f} MHz (A={ic}, B={jc})"),
+    ("IM2_diff", "IM2", "Beat Frequency", "{ic}_{il} - {jc}_{jl}",
+     "IM2 Beat: {iv} - {jv} = {f:.1f} MHz (A={ic}, B={jc})"),
+    ("IM2_rdiff", "IM2", "Beat Frequency", "{jc}_{jl} - {ic}_{il}",
+     "IM2 Beat: {jv} - {iv} = {f:.1f} MHz (B={jc}, A={ic})"),
+    ("IM3_fund_A", "IM3", "Fundamental-only", "2×{ic}_{il} {op} {jc}_{jl}",
+     "IM3 (Fundamental-only): 2×{iv} {op} {jv} = {f:.1f} MHz (A={ic}, B={jc})"),
+    ("IM3_fund_B", "IM3", "Fundamental-only", "2×{jc}_{jl} {op} {ic}_{il}",
+     "IM3 (Fundamental-only): 2×{jv} {op} {iv} = {f:.1f} MHz (B={jc}, A={ic})"),
+    ("IM3_h2_A", "IM3", "2nd Harmonic of A vs Fundamental B", "2×(2×{ic}_{il}) {op} {jc}_{jl}",
+     "IM3 (2nd Harmonic of A vs Fundamental B): 2×(2×{iv}) {op} {jv} = {f:.1f} MHz (A={ic}, B={jc})"),
+    ("IM3_h2_B", "IM3", "2nd Harmonic of B vs Fundamental A", "2×(2×{jc}_{jl}) {op} {ic}_{il}",
+     "IM3 (2nd Harmonic of B vs Fundamental A): 2×(2×{jv}) {op} {iv} = {f:.1f} MHz (B={jc}, A={ic})"),
+    ("IM3_h2h2_A", "IM3", "2nd Harmonic of A vs 2nd Harmonic of B", "2×{ic}_{il} {op} 2×{jc}_{jl}",
+     "IM3 (2nd Harmonic of A vs 2nd Harmonic of B): 2×{iv} {op} 2×{jv} = {f:.1f} MHz (A={ic}, B={jc})"),
+    ("IM3_h2h2_B", "IM3", "2nd Harmonic of B vs 2nd Harmonic of A", "2×{jc}_{jl} {op} 2×{ic}_{il}",
+     "IM3 (2nd Harmonic of B vs 2nd Harmonic of A): 2×{jv} {op} 2×{iv} = {f:.1f} MHz (B={jc}, A={ic})"),
+    ("IM4_2_2", "IM4", "Higher-order", "2×{ic}_{il} + 2×{jc}_{jl}",
+     "IM4: 2×{iv} + 2×{jv} = {f:.1f} MHz (A={ic}, B={jc})"),
+    ("IM4_3_1", "IM4", "Higher-order", "3×{ic}_{il} + 1×{jc}_{jl}",
+     "IM4: 3×{iv} + 1×{jv} = {f:.1f} MHz (A={ic}, B={jc})"),
+    ("IM4_1_3", "IM4", "Higher-order", "1×{ic}_{il} + 3×{jc}_{jl}",
+     "IM4: 1×{iv} + 3×{jv} = {f:.1f} MHz (A={ic}, B={jc})"),
+    ("IM5_3_2", "IM5", "Higher-order", "3×{ic}_{il} {op} 2×{jc}_{jl}",
+     "IM5: 3×{iv} {op} 2×{jv} = {f:.1f} MHz (A={ic}, B={jc})"),
+    ("IM5_2_3", "IM5", "Higher-order", "2×{ic}_{il} {op} 3×{jc}_{jl}",
+     "IM5: 2×{iv} {op} 3×{jv} = {f:.1f} MHz (A={ic}, B={jc})"),
+    ("IM7_4_3", "IM7", "Higher-order", "4×{ic}_{il} {op} 3×{jc}_{jl}",
+     "IM7: 4×{iv} {op} 3×{jv} = {f:.1f} MHz (A={ic}, B={jc})"),
+    ("ACLR", "ACLR", "Adjacent-channel", "{ic}_tx_high vs {jc}_rx_low",
+     "ACLR: {iv} MHz vs {jv} MHz (gap: {gap:.1f} MHz)"),
+)
+_FAMILY_INDEX = {family[0]: k for k, family in enumerate(_PRODUCT_FAMILIES)}
+
+class _MixingProduct(NamedTuple):
+    """
+    One two-tone mixing product family c_A·A ± c_B·B. Signed families produce both
+    c_A·A - c_B·B and c_A·A + c_B·B. Swapped families are the (B, A) mirror of the grid
+    (2B ± A, ...). For symmetric families the (j, i) orientation of a pair repeats a
+    product of the (i, j) orientation, so only i < j is generated. Block/sub reproduce
+    the generation order of the original nested loops, which decides which duplicate
+    survives deduplication.
+    """
+    family: str
+    coef_a: int
+    coef_b: int
+    signed: bool
+    swapped: bool
+    symmetric: bool
+    block: int
+    sub: int
+    option: Optional[str]  # enabling IMD option, None = always on
+
+
+# All evaluated in one fused broadcast, as
+# (family, c_A, c_B, signed, swapped, symmetric, block, sub, enabling option)
+_MIXING_PRODUCTS = tuple(_MixingProduct(*m) for m in (
+    ("IM2_sum", 1, 1, False, False, False, 0, 0, "imd2"),
+    ("IM2_diff", 1, -1, False, False, False, 0, 1, "imd2"),
+    ("IM2_rdiff", -1, 1, False, False, False, 0, 2, "imd2"),
+    ("IM3_fund_A", 2, 1, True, False, True, 0, 0, None),
+    ("IM3_fund_B", 2, 1, True, True, True, 1, 0, None),
+    ("IM3_h2_A", 4, 1, True, False, True, 2, 0, None),
+    ("IM3_h2_B", 4, 1, True, True, True, 3, 0, None),
+    ("IM3_h2h2_A", 2, 2, True, False, True, 4, 0, None),
+    ("IM3_h2h2_B", 2, 2, True, True, True, 5, 0, None),
+    ("IM4_2_2", 2, 2, False, False, True, 6, 0, "imd4"),
+    ("IM4_3_1", 3, 1, False, False, True, 6, 1, "imd4"),
+    ("IM4_1_3", 1, 3, False, False, True, 6, 2, "imd4"),
+    ("IM5_3_2", 3, 2, True, False, False, 7, 0, "imd5"),
+    ("IM5_2_3", 2, 3, True, False, False, 7, 1, "imd5"),
+    ("IM7_4_3", 4, 3, True, False, False, 8, 0, "imd7"),
+))
+# Radices of the generation order key: blocks per band pair and sub-products per block
+_N_BLOCKS = max(m.block for m in _MIXING_PRODUCTS) + 1
+_N_SUBS = max(m.sub for m in _MIXING_PRODUCTS) + 1
+# Columnar product buffer dtypes: family index, band pair (-1 = none), edge indices,
+# sign, centi-MHz frequency and generation order
+_PRODUCT_COLUMNS = (
+    ("family", np.int8), ("i", np.int16), ("j", np.int16), ("ei", np.int8), ("ej", np.int8),
+    ("sign", np.int8), ("centi", np.int32), ("order", np.int64),
+)
+_HARMONIC_ORDERS = np.array([2, 3, 4, 5], dtype=np.int32)
+_HARMONIC_FAMILIES = np.array([_FAMILY_INDEX[f"{order}H"] for order in _HARMONIC_ORDERS.tolist()])
+# Sort priority of each family, precomputed from SIGNAL_LEVEL_PRIORITY by its Type
+_FAMILY_SIGNAL_PRIORITY = np.array([SIGNAL_LEVEL_PRIORITY.get(family[1], 99) for family in _PRODUCT_FAMILIES])
+_FAMILY_TYPE_CODE = np.array([PRODUCT_TYPES.index(family[1]) for family in _PRODUCT_FAMILIES])
+# Two-tone products key their aggressors by band pair; harmonics and ACLR by a single band
+_FAMILY_IS_PAIR = np.array([family[1].startswith("IM") for family in _PRODUCT_FAMILIES])
+
+
+@lru_cache(maxsize=None)
+def _mixing_table(imd2: bool, imd4: bool, imd5: bool, imd7: bool):
+    """
+    The _MIXING_PRODUCTS enabled by one IMD flag combination, their broadcast
+    coefficients c_A and ±c_B (trailing axis is the sign) and the product count per
+    band pair. The flags are fixed for a whole analysis, so this is built once per combination.
+    """
+    enabled = {None: True, "imd2": imd2, "imd4": imd4, "imd5": imd5, "imd7": imd7}
+    mixing = tuple(m for m in _MIXING_PRODUCTS if enabled[m.option])
+    coef_a = np.array([m.coef_a for m in mixing])[:, None, None, None, None, None]
+    signed_b = np.array([-1, 1]) * np.array([m.coef_b for m in mixing])[:, None, None, None, None, None]
+    per_pair = sum(4*(2 if m.signed else 1) for m in mixing)
+    return mixing, coef_a, signed_b, per_pair
+
+
+def _band_fields(band: Band) -> Tuple[str, Tuple[Tuple[float, str], Tuple[float, str]], float, float]:
+    """Display fields of one band: code, Tx edges as (value, 'low'/'high' label), Tx high, Rx low."""
+    high_label = 'low' if band.tx_high == band.tx_low else 'high'
+    return band.code, ((band.tx_low, 'low'), (band.tx_high, high_label)), band.tx_high, band.rx_low
+
+
+def _template_fields(family: int, i: int, j: int, edge_i: int, edge_j: int, sign: int,
+                     frequency: float, band_fields: List[Tuple]) -> Dict:
+    """Values of the Formula / Details template placeholders of one product row."""
+    product_type = _PRODUCT_FAMILIES[family][1]
+    code_i, edges_i, tx_high_i, _ = band_fields[i]
+    fields = dict(ic=code_i, f=frequency, op='+' if sign > 0 else '-')
+    if product_type == "ACLR":
+        code_j, _, _, rx_low_j = band_fields[j]
+        fields.update(jc=code_j, iv=tx_high_i, jv=rx_low_j, gap=abs(tx_high_i - rx_low_j))
+    else:
+        fields['iv'], fields['il'] = edges_i[edge_i]
+        if j >= 0:
+            code_j, edges_j, _, _ = band_fields[j]
+            fields['jc'] = code_j
+            fields['jv'], fields['jl'] = edges_j[edge_j]
+    return fields
+
+
+def _render_row(family: int, i: int, j: int, edge_i: int, edge_j: int, sign: int, frequency: float,
+                formula: str, aggressors: str, victim: int, severity: int, band_fields: List[Tuple]) -> Dict:
+    """Build the public result dict for one product row (victim -1 is the safe row, severity 0)."""
+    name, product_type, im3_type, _, details = _PRODUCT_FAMILIES[family]
+    fields = _template_fields(family, i, j, edge_i, edge_j, sign, frequency, band_fields)
+    victim_code = band_fields[victim][0] if victim >= 0 else ''
+    return dict(
+        Type=product_type,
+        IM3_Type=im3_type,
+        Formula=formula,
+        Frequency_MHz=frequency,
+        Aggressors=aggressors,
+        Victims=victim_code,
+        Risk=risk_symbol(severity),
+        Severity=severity,
+        Details=details.format(**fields),
+    )
+
+
+def calculate_all_products(selected_bands: List[Band], guard: float = 0.0, imd2: bool = True, imd4: bool = False, imd5: bool = True, imd7: bool = False, aclr_margin: float = 0.0, include_safe_rows: bool = True) -> Tuple[List[Dict], List[str]]:
     """
     Exhaustive IMD/harmonic/overlap logic for all selected bands, matching app.py.
     Returns (results, overlap_alerts).
+    With include_safe_rows=False only products hitting a victim are returned; the
+    number of omitted safe products is reported as a note in overlap_alerts.
     """
-    results = []
     overlap_alerts = []
     n = len(selected_bands)
-    # Overlap checks (Tx/Tx, Rx/Rx, Tx in Rx, Rx in Tx)
-    for i in range(n):
-        b1 = selected_bands[i]
-        for j in range(i+1, n):
-            b2 = selected_bands[j]
-            b1_tx_low = b1.tx_low - guard
-            b1_tx_high = b1.tx_high + guard
-            b2_tx_low = b2.tx_low - guard
-            b2_tx_high = b2.tx_high + guard
-            b1_rx_low = b1.rx_low - guard
-            b1_rx_high = b1.rx_high + guard
-            b2_rx_low = b2.rx_low - guard
-            b2_rx_high = b2.rx_high + guard
-            
-            # Tx-Tx overlap (skip if either band is receive-only)
-            b1_has_tx = not (b1.tx_low == 0 and b1.tx_high == 0)
-            b2_has_tx = not (b2.tx_low == 0 and b2.tx_high == 0)
-            
-            if b1_has_tx and b2_has_tx:
-                if not (b1_tx_high < b2_tx_low or b2_tx_high < b1_tx_low):
-                    overlap_alerts.append(f"Tx band overlap: {b1.code} ({b1.tx_low}-{b1.tx_high} MHz) and {b2.code} ({b2.tx_low}-{b2.tx_high} MHz)")
-                    
-            # Rx-Rx overlap
-            if not (b1_rx_high < b2_rx_low or b2_rx_high < b1_rx_low):
-                overlap_alerts.append(f"Rx band overlap: {b1.code} ({b1.rx_low}-{b1.rx_high} MHz) and {b2.code} ({b2.rx_low}-{b2.rx_high} MHz)")
-                
-            # Tx of one in Rx of other (skip if transmitting band is receive-only)
-            if b1_has_tx and not (b1_tx_high < b2_rx_low or b1_tx_low > b2_rx_high):
-                overlap_alerts.append(f"Tx({b1.code}) overlaps Rx({b2.code})")
-            if b2_has_tx and not (b2_tx_high < b1_rx_low or b2_tx_low > b1_rx_high):
-                overlap_alerts.append(f"Tx({b2.code}) overlaps Rx({b1.code})")
-
-    # Harmonics (2H, 3H, 4H, 5H) - Skip receive-only bands (tx_low = tx_high = 0)
-    for b in selected_bands:
-        # Skip receive-only bands like GNSS
-        if b.tx_low == 0 and b.tx_high == 0:
-            continue
-            
-        for order in (2, 3, 4, 5):
-            for edge in [b.tx_low, b.tx_high]:
-                if edge == 0:  # Additional safety check
-                    continue
-                freq = edge * order
-                for victim in selected_bands:
-                    rx_low = victim.rx_low - guard
-                    rx_high = victim.rx_high + guard
-                    risk = rx_low <= freq <= rx_high
-                    
-                    # Enhanced risk assessment with severity
-                    if risk:
-                        risk_symbol, severity = assess_risk_severity(freq, victim.code, b.code, f"{order}H")
-                    else:
-                        risk_symbol, severity = "✅", 0
-                    
-                    results.append(dict(
-                        Type=f"{order}H",
-                        IM3_Type="Harmonic",
-                        Formula=f"{order}×Tx_{'low' if edge==b.tx_low else 'high'}({b.code})",
-                        Frequency_MHz=round(freq, 2),
-                        Aggressors=b.code,
-                        Victims=victim.code if risk else '',
-                        Risk=risk_symbol,
-                        Severity=severity,
-                        Details=f"{order}th Harmonic: {order}×{edge} = {freq:.1f} MHz (Band: {b.code})",
-                    ))
-
-    # IM2 Beat Terms (f₁ ± f₂) - Critical for wideband systems, often higher than IM3
-    if imd2:
-        for i in range(n):
-            b1 = selected_bands[i]
-            # Skip receive-only bands as aggressors
-            if b1.tx_low == 0 and b1.tx_high == 0:
-                continue
-                
-            for j in range(i+1, n):  # Avoid duplicates with i+1
-                b2 = selected_bands[j]
-                # Skip receive-only bands as aggressors  
-                if b2.tx_low == 0 and b2.tx_high == 0:
-                    continue
-                    
-                A_edges = [b1.tx_low, b1.tx_high]
-                B_edges = [b2.tx_low, b2.tx_high]
-                
-                for A in A_edges:
-                    if A == 0:  # Additional safety check
-                        continue
-                    for B in B_edges:
-                        if B == 0:  # Additional safety check
-                            continue
-                        
-                        # f₁ + f₂ and f₁ - f₂ (and f₂ - f₁)
-                        for sign, op_str in [(1, '+'), (-1, '-')]:
-                            freq_plus_minus = A + sign * B
-                            if freq_plus_minus > 0:  # Only positive frequencies
-                                for victim in selected_bands:
-                                    rx_low = victim.rx_low - guard
-                                    rx_high = victim.rx_high + guard
-                                    risk = rx_low <= freq_plus_minus <= rx_high
-                                    
-                                    # Enhanced risk assessment with severity
-                                    if risk:
-                                        risk_symbol, severity = assess_risk_severity(freq_plus_minus, victim.code, f"{b1.code}, {b2.code}", "IM2")
-                                    else:
-                                        risk_symbol, severity = "✅", 0
-                                    
-                                    results.append(dict(
-                                        Type="IM2",
-                                        IM3_Type="Beat Frequency",
-                                        Formula=f"{b1.code}_{'low' if A==b1.tx_low else 'high'} {op_str} {b2.code}_{'low' if B==b2.tx_low else 'high'}",
-                                        Frequency_MHz=round(freq_plus_minus, 2),
-                                        Aggressors=f"{b1.code}, {b2.code}",
-                                        Victims=victim.code if risk else '',
-                                        Risk=risk_symbol,
-                                        Severity=severity,
-                                        Details=f"IM2 Beat: {A} {op_str} {B} = {freq_plus_minus:.1f} MHz (A={b1.code}, B={b2.code})",
-                                    ))
-                            
-                            # Also calculate B ± A to be thorough
-                            if sign == -1:  # Only for subtraction to avoid complete duplication
-                                freq_reverse = B - A
-                                if freq_reverse > 0:  # Only positive frequencies
-                                    for victim in selected_bands:
-                                        rx_low = victim.rx_low - guard
-                                        rx_high = victim.rx_high + guard
-                                        risk = rx_low <= freq_reverse <= rx_high
-                                        
-                                        # Enhanced risk assessment with severity
-                                        if risk:
-                                            risk_symbol, severity = assess_risk_severity(freq_reverse, victim.code, f"{b1.code}, {b2.code}", "IM2")
-                                        else:
-                                            risk_symbol, severity = "✅", 0
-                                        
-                                        results.append(dict(
-                                            Type="IM2",
-                                            IM3_Type="Beat Frequency",
-                                            Formula=f"{b2.code}_{'low' if B==b2.tx_low else 'high'} - {b1.code}_{'low' if A==b1.tx_low else 'high'}",
-                                            Frequency_MHz=round(freq_reverse, 2),
-                                            Aggressors=f"{b1.code}, {b2.code}",
-                                            Victims=victim.code if risk else '',
-                                            Risk=risk_symbol,
-                                            Severity=severity,
-                                            Details=f"IM2 Beat: {B} - {A} = {freq_reverse:.1f} MHz (B={b2.code}, A={b1.code})",
-                                        ))
-
-    # IM3 exhaustive edge cases (all band pairs, all edges)
-    for i in range(n):
-        b1 = selected_bands[i]
-        # Skip receive-only bands as aggressors
-        if b1.tx_low == 0 and b1.tx_high == 0:
-            continue
-            
-        for j in range(n):
-            if i == j:
-                continue
-            b2 = selected_bands[j]
-            # Skip receive-only bands as aggressors  
-            if b2.tx_low == 0 and b2.tx_high == 0:
-                continue
-                
-            A_edges = [b1.tx_low, b1.tx_high]
-            B_edges = [b2.tx_low, b2.tx_high]
-            # Fundamental-only (2A ± B, 2B ± A)
-            for A in A_edges:
-                if A == 0:  # Additional safety check
-                    continue
-                for B in B_edges:
-                    if B == 0:  # Additional safety check
-                        continue
-                    for sign in [-1, 1]:
-                        freq1 = 2*A + sign*B
-                        for victim in selected_bands:
-                            rx_low = victim.rx_low - guard
-                            rx_high = victim.rx_high + guard
-                            risk = rx_low <= freq1 <= rx_high
-                            
-                            # Enhanced risk assessment with severity
-                            if risk:
-                                risk_symbol, severity = assess_risk_severity(freq1, victim.code, f"{b1.code}, {b2.code}", "IM3")
-                            else:
-                                risk_symbol, severity = "✅", 0
-                            
-                            results.append(dict(
-                                Type="IM3",
-                                IM3_Type="Fundamental-only",
-                                Formula=f"2×{b1.code}_{'low' if A==b1.tx_low else 'high'} {'+' if sign>0 else '-'} {b2.code}_{'low' if B==b2.tx_low else 'high'}",
-                                Frequency_MHz=round(freq1, 2),
-                                Aggressors=f"{b1.code}, {b2.code}",
-                                Victims=victim.code if risk else '',
-                                Risk=risk_symbol,
-                                Severity=severity,
-                                Details=f"IM3 (Fundamental-only): 2×{A} {'+' if sign>0 else '-'} {B} = {freq1:.1f} MHz (A={b1.code}, B={b2.code})",
-                            ))
-            for B in B_edges:
-                for A in A_edges:
-                    for sign in [-1, 1]:
-                        freq2 = 2*B + sign*A
-                        for victim in selected_bands:
-                            rx_low = victim.rx_low - guard
-                            rx_high = victim.rx_high + guard
-                            risk = rx_low <= freq2 <= rx_high
-                            
-                            # Enhanced risk assessment with severity
-                            if risk:
-                                risk_symbol, severity = assess_risk_severity(freq2, victim.code, f"{b1.code}, {b2.code}", "IM3")
-                            else:
-                                risk_symbol, severity = "✅", 0
-                            
-                            results.append(dict(
-                                Type="IM3",
-                                IM3_Type="Fundamental-only",
-                                Formula=f"2×{b2.code}_{'low' if B==b2.tx_low else 'high'} {'+' if sign>0 else '-'} {b1.code}_{'low' if A==b1.tx_low else 'high'}",
-                                Frequency_MHz=round(freq2, 2),
-                                Aggressors=f"{b1.code}, {b2.code}",
-                                Victims=victim.code if risk else '',
-                                Risk=risk_symbol,
-                                Severity=severity,
-                                Details=f"IM3 (Fundamental-only): 2×{B} {'+' if sign>0 else '-'} {A} = {freq2:.1f} MHz (B={b2.code}, A={b1.code})",
-                            ))
-            # Mixed 2nd-harmonic/fundamental (2*(2A) ± B, 2*(2B) ± A)
-            for A in A_edges:
-                for B in B_edges:
-                    for sign in [-1, 1]:
-                        freq3 = 2*(2*A) + sign*B
-                        for victim in selected_bands:
-                            rx_low = victim.rx_low - guard
-                            rx_high = victim.rx_high + guard
-                            risk = rx_low <= freq3 <= rx_high
-                            results.append(dict(
-                                Type="IM3",
-                                IM3_Type="2nd Harmonic of A vs Fundamental B",
-                                Formula=f"2×(2×{b1.code}_{'low' if A==b1.tx_low else 'high'}) {'+' if sign>0 else '-'} {b2.code}_{'low' if B==b2.tx_low else 'high'}",
-                                Frequency_MHz=round(freq3, 2),
-                                Aggressors=f"{b1.code}, {b2.code}",
-                                Victims=victim.code if risk else '',
-                                Risk="⚠️" if risk else "✓",
-                                Details=f"IM3 (2nd Harmonic of A vs Fundamental B): 2×(2×{A}) {'+' if sign>0 else '-'} {B} = {freq3:.1f} MHz (A={b1.code}, B={b2.code})",
-                            ))
-            for B in B_edges:
-                for A in A_edges:
-                    for sign in [-1, 1]:
-                        freq4 = 2*(2*B) + sign*A
-                        for victim in selected_bands:
-                            rx_low = victim.rx_low - guard
-                            rx_high = victim.rx_high + guard
-                            risk = rx_low <= freq4 <= rx_high
-                            results.append(dict(
-                                Type="IM3",
-                                IM3_Type="2nd Harmonic of B vs Fundamental A",
-                                Formula=f"2×(2×{b2.code}_{'low' if B==b2.tx_low else 'high'}) {'+' if sign>0 else '-'} {b1.code}_{'low' if A==b1.tx_low else 'high'}",
-                                Frequency_MHz=round(freq4, 2),
-                                Aggressors=f"{b1.code}, {b2.code}",
-                                Victims=victim.code if risk else '',
-                                Risk="⚠️" if risk else "✓",
-                                Details=f"IM3 (2nd Harmonic of B vs Fundamental A): 2×(2×{B}) {'+' if sign>0 else '-'} {A} = {freq4:.1f} MHz (B={b2.code}, A={b1.code})",
-                            ))
-            # 2nd Harmonic of both (2A ± 2B, 2B ± 2A)
-            for A in A_edges:
-                for B in B_edges:
-                    for sign in [-1, 1]:
-                        freq5 = 2*A + sign*2*B
-                        for victim in selected_bands:
-                            rx_low = victim.rx_low - guard
-                            rx_high = victim.rx_high + guard
-                            risk = rx_low <= freq5 <= rx_high
-                            results.append(dict(
-                                Type="IM3",
-                                IM3_Type="2nd Harmonic of A vs 2nd Harmonic of B",
-                                Formula=f"2×{b1.code}_{'low' if A==b1.tx_low else 'high'} {'+' if sign>0 else '-'} 2×{b2.code}_{'low' if B==b2.tx_low else 'high'}",
-                                Frequency_MHz=round(freq5, 2),
-                                Aggressors=f"{b1.code}, {b2.code}",
-                                Victims=victim.code if risk else '',
-                                Risk="⚠️" if risk else "✓",
-                                Details=f"IM3 (2nd Harmonic of A vs 2nd Harmonic of B): 2×{A} {'+' if sign>0 else '-'} 2×{B} = {freq5:.1f} MHz (A={b1.code}, B={b2.code})",
-                            ))
-            for B in B_edges:
-                for A in A_edges:
-                    for sign in [-1, 1]:
-                        freq6 = 2*B + sign*2*A
-                        for victim in selected_bands:
-                            rx_low = victim.rx_low - guard
-                            rx_high = victim.rx_high + guard
-                            risk = rx_low <= freq6 <= rx_high
-                            results.append(dict(
-                                Type="IM3",
-                                IM3_Type="2nd Harmonic of B vs 2nd Harmonic of A",
-                                Formula=f"2×{b2.code}_{'low' if B==b2.tx_low else 'high'} {'+' if sign>0 else '-'} 2×{b1.code}_{'low' if A==b1.tx_low else 'high'}",
-                                Frequency_MHz=round(freq6, 2),
-                                Aggressors=f"{b1.code}, {b2.code}",
-                                Victims=victim.code if risk else '',
-                                Risk="⚠️" if risk else "✓",
-                                Details=f"IM3 (2nd Harmonic of B vs 2nd Harmonic of A): 2×{B} {'+' if sign>0 else '-'} 2×{A} = {freq6:.1f} MHz (B={b2.code}, A={b1.code})",
-                            ))
-            # IM4 (2f1+2f2, 3f1+f2, f1+3f2)
-            if imd4:
-                for A in A_edges:
-                    for B in B_edges:
-                        # Standard IM4: 2f1+2f2
-                        freq4_std = 2*A + 2*B
-                        for victim in selected_bands:
-                            rx_low = victim.rx_low - guard
-                            rx_high = victim.rx_high + guard
-                            risk = rx_low <= freq4_std <= rx_high
-                            results.append(dict(
-                                Type="IM4",
-                                IM3_Type="Higher-order",
-                                Formula=f"2×{b1.code}_{'low' if A==b1.tx_low else 'high'} + 2×{b2.code}_{'low' if B==b2.tx_low else 'high'}",
-                                Frequency_MHz=round(freq4_std, 2),
-                                Aggressors=f"{b1.code}, {b2.code}",
-                                Victims=victim.code if risk else '',
-                                Risk="⚠️" if risk else "✓",
-                                Details=f"IM4: 2×{A} + 2×{B} = {freq4_std:.1f} MHz (A={b1.code}, B={b2.code})",
-                            ))
-                        
-                        # Extended IM4: 3f1+f2 and f1+3f2
-                        for coeff1, coeff2 in [(3, 1), (1, 3)]:
-                            freq4_ext = coeff1*A + coeff2*B
-                            for victim in selected_bands:
-                                rx_low = victim.rx_low - guard
-                                rx_high = victim.rx_high + guard
-                                risk = rx_low <= freq4_ext <= rx_high
-                                results.append(dict(
-                                    Type="IM4",
-                                    IM3_Type="Higher-order",
-                                    Formula=f"{coeff1}×{b1.code}_{'low' if A==b1.tx_low else 'high'} + {coeff2}×{b2.code}_{'low' if B==b2.tx_low else 'high'}",
-                                    Frequency_MHz=round(freq4_ext, 2),
-                                    Aggressors=f"{b1.code}, {b2.code}",
-                                    Victims=victim.code if risk else '',
-                                    Risk="⚠️" if risk else "✓",
-                                    Details=f"IM4: {coeff1}×{A} + {coeff2}×{B} = {freq4_ext:.1f} MHz (A={b1.code}, B={b2.code})",
-                                ))
-            # IM5 (3f1±2f2, 2f1±3f2)
-            if imd5:
-                for A in A_edges:
-                    for B in B_edges:
-                        # Standard IM5: 3f1±2f2
-                        for sign in [-1, 1]:
-                            freq5_std = 3*A + sign*2*B
-                            for victim in selected_bands:
-                                rx_low = victim.rx_low - guard
-                                rx_high = victim.rx_high + guard
-                                risk = rx_low <= freq5_std <= rx_high
-                                results.append(dict(
-                                    Type="IM5",
-                                    IM3_Type="Higher-order",
-                                    Formula=f"3×{b1.code}_{'low' if A==b1.tx_low else 'high'} {'+' if sign>0 else '-'} 2×{b2.code}_{'low' if B==b2.tx_low else 'high'}",
-                                    Frequency_MHz=round(freq5_std, 2),
-                                    Aggressors=f"{b1.code}, {b2.code}",
-                                    Victims=victim.code if risk else '',
-                                    Risk="⚠️" if risk else "✓",
-                                    Details=f"IM5: 3×{A} {'+' if sign>0 else '-'} 2×{B} = {freq5_std:.1f} MHz (A={b1.code}, B={b2.code})",
-                                ))
-                        
-                        # Extended IM5: 2f1±3f2
-                        for sign in [-1, 1]:
-                            freq5_ext = 2*A + sign*3*B
-                            for victim in selected_bands:
-                                rx_low = victim.rx_low - guard
-                                rx_high = victim.rx_high + guard
-                                risk = rx_low <= freq5_ext <= rx_high
-                                results.append(dict(
-                                    Type="IM5",
-                                    IM3_Type="Higher-order",
-                                    Formula=f"2×{b1.code}_{'low' if A==b1.tx_low else 'high'} {'+' if sign>0 else '-'} 3×{b2.code}_{'low' if B==b2.tx_low else 'high'}",
-                                    Frequency_MHz=round(freq5_ext, 2),
-                                    Aggressors=f"{b1.code}, {b2.code}",
-                                    Victims=victim.code if risk else '',
-                                    Risk="⚠️" if risk else "✓",
-                                    Details=f"IM5: 2×{A} {'+' if sign>0 else '-'} 3×{B} = {freq5_ext:.1f} MHz (A={b1.code}, B={b2.code})",
-                                ))
-            # IM7 (4f1±3f2)
-            if imd7:
-                for A in A_edges:
-                    for B in B_edges:
-                        for sign in [-1, 1]:
-                            freq7 = 4*A + sign*3*B
-                            for victim in selected_bands:
-                                rx_low = victim.rx_low - guard
-                                rx_high = victim.rx_high + guard
-                                risk = rx_low <= freq7 <= rx_high
-                                results.append(dict(
-                                    Type="IM7",
-                                    IM3_Type="Higher-order",
-                                    Formula=f"4×{b1.code}_{'low' if A==b1.tx_low else 'high'} {'+' if sign>0 else '-'} 3×{b2.code}_{'low' if B==b2.tx_low else 'high'}",
-                                    Frequency_MHz=round(freq7, 2),
-                                    Aggressors=f"{b1.code}, {b2.code}",
-                                    Victims=victim.code if risk else '',
-                                    Risk="⚠️" if risk else "✓",
-                                    Details=f"IM7: 4×{A} {'+' if sign>0 else '-'} 3×{B} = {freq7:.1f} MHz (A={b1.code}, B={b2.code})",
-                                ))
-    # ACLR check (optional, for all pairs)
-    if aclr_margin > 0:
-        for i in range(n):
-            b1 = selected_bands[i]
-            # Skip receive-only bands for ACLR (no transmission)
-            if b1.tx_low == 0 and b1.tx_high == 0:
-                continue
-                
-            for j in range(n):
-                if i == j:
-                    continue
-                b2 = selected_bands[j]
-                aclr_risk = aclr_check(b1.tx_high, b2.rx_low, aclr_margin)
-                results.append(dict(
-                    Type="ACLR",
-                    IM3_Type="Adjacent-channel",
-                    Formula=f"{b1.code}_tx_high vs {b2.code}_rx_low",
-                    Frequency_MHz=round((b1.tx_high + b2.rx_low) / 2, 2),
-                    Aggressors=b1.code,
-                    Victims=b2.code if aclr_risk else '',
-                    Risk="⚠️" if aclr_risk else "✓",
-                    Details=f"ACLR: {b1.tx_high} MHz vs {b2.rx_low} MHz (gap: {abs(b1.tx_high - b2.rx_low):.1f} MHz)",
-                ))
-    # Deduplicate: focus on mathematical uniqueness rather than descriptive differences
-    seen = set()
-    deduped = []
-    for r in results:
-        # Update legacy risk symbols with severity assessment
-        if r.get('Risk') in ['⚠️', '✓'] and 'Severity' not in r:
-            freq = r.get('Frequency_MHz', 0)
-            victim = r.get('Victims', '')
-            aggressors = r.get('Aggressors', '')
-            product_type = r.get('Type', '')
-            
-            if r.get('Risk') == '⚠️' and victim:  # Only assess risk items with victims
-                risk_symbol, severity = assess_risk_severity(freq, victim, aggressors, product_type)
-                r['Risk'] = risk_symbol
-                r['Severity'] = severity
-            elif r.get('Risk') == '✓':
-                r['Risk'] = '✅'
-                r['Severity'] = 0
-        
-        # Create unique key based on actual mathematical content
-        freq = r.get('Frequency_MHz', 0)
-        aggressors = tuple(sorted(r.get('Aggressors', '').split(', '))) if r.get('Aggressors') else ()
-        victims = r.get('Victims', '')
-        
-        # For mathematical uniqueness, ignore descriptive IM3_Type differences
-        # Same frequency + same aggressors + same victims = duplicate
-        key = (
-            r.get('Type'),
-            round(freq, 2) if freq else 0,  # Round to avoid floating point precision issues
-            aggressors,  # Sorted aggressor list to handle order differences
-            victims,
-        )
-        if key not in seen:
-            seen.add(key)
-            deduped.append(r)
-    # Sort: risk items (Risk='⚠️') at the top, ordered by signal level priority, then by Type, Formula, Frequency_MHz
-    def get_signal_level_priority(r):
-        """Return priority based on typical signal level (lower number = higher signal level)"""
-        imd_type = r.get('Type', '')
-        if imd_type == '2H':
-            return 1  # 2nd harmonic - typically highest
-        elif imd_type == 'IM2':
-            return 2  # IM2 beat terms - often higher than IM3
-        elif imd_type == '3H':
-            return 3  # 3rd harmonic
-        elif imd_type == 'IM3':
-            return 4  # IM3 - most common analysis
-        elif imd_type == '4H':
-            return 5  # 4th harmonic
-        elif imd_type == 'IM4':
-            return 6  # IM4
-        elif imd_type == '5H':
-            return 7  # 5th harmonic
-        elif imd_type == 'IM5':
-            return 8  # IM5
-        elif imd_type == 'IM7':
-            return 9  # IM7 - lowest typical signal level
-        elif imd_type == 'ACLR':
-            return 10  # ACLR - different mechanism
+
+    # Band edges and guard-widened windows, pulled out of the Band objects once; every
+    # product family below is generated and tested against all victims by broadcasting.
+    soa = bands_to_soa(selected_bands)
+    tx, rx = soa.tx, soa.rx
+    rx_low = rx[:, 0] - guard
+    rx_high = rx[:, 1] + guard
+    # Fixed-point core: product arithmetic runs on int32 centi-MHz (0.01 MHz, the
+    # resolution of Frequency_MHz), which is exact and makes the dedup key deterministic
+    tx_c = np.rint(tx * 100).astype(np.int32)
+    rx_c = np.rint(rx * 100).astype(np.int32)
+    rx_low_c = np.rint(rx_low * 100).astype(np.int32)
+    rx_high_c = np.rint(rx_high * 100).astype(np.int32)
+    nonzero_edge = tx != 0
+    has_tx = nonzero_edge.any(axis=1)  # receive-only bands (tx_low = tx_high = 0) never transmit
+
+    # Overlap checks (Tx/Tx, Rx/Rx, Tx in Rx, Rx in Tx) for every pair i < j at once.
+    # The trailing axis holds the four checks in alert order; receive-only bands never
+    # take part as the transmitting side.
+    tx_lo_g, tx_hi_g = tx[:, 0] - guard, tx[:, 1] + guard
+    overlaps = np.stack([
+        has_tx[:, None] & has_tx[None, :] & ~((tx_hi_g[:, None] < tx_lo_g[None, :]) | (tx_hi_g[None, :] < tx_lo_g[:, None])),
+        ~((rx_high[:, None] < rx_low[None, :]) | (rx_high[None, :] < rx_low[:, None])),
+        has_tx[:, None] & ~((tx_hi_g[:, None] < rx_low[None, :]) | (tx_lo_g[:, None] > rx_high[None, :])),
+        has_tx[None, :] & ~((tx_hi_g[None, :] < rx_low[:, None]) | (tx_lo_g[None, :] > rx_high[:, None])),
+    ], axis=-1) & np.triu(np.ones((n, n), dtype=bool), 1)[:, :, None]
+    for i, j, check in zip(*(x.tolist() for x in np.nonzero(overlaps))):
+        b1, b2 = selected_bands[i], selected_bands[j]
+        if check == 0:
+            overlap_alerts.append(f"Tx band overlap: {b1.code} ({b1.tx_low}-{b1.tx_high} MHz) and {b2.code} ({b2.tx_low}-{b2.tx_high} MHz)")
+        elif check == 1:
+            overlap_alerts.append(f"Rx band overlap: {b1.code} ({b1.rx_low}-{b1.rx_high} MHz) and {b2.code} ({b2.rx_low}-{b2.rx_high} MHz)")
+        elif check == 2:
+            overlap_alerts.append(f"Tx({b1.code}) overlaps Rx({b2.code})")
         else:
-            return 99  # Unknown types
-    
-    def sort_key(r):
-        # Sort by severity (high to low), then by signal priority, then by other factors
-        severity = r.get('Severity', 0)
-        # Convert severity to sort priority (higher severity = lower sort value = appears first)
-        severity_priority = 6 - severity if severity > 0 else 10  # Risk items first, then safe items
-        signal_priority = get_signal_level_priority(r)
-        freq = r.get('Frequency_MHz', 0)
-        return (severity_priority, signal_priority, str(r.get('Type')), str(r.get('Formula')), freq)
-    
-    deduped.sort(key=sort_key)
-    
-    # Filter out physically invalid frequencies (negative or zero)
-    valid_results = []
-    invalid_count = 0
-    
-    for result in deduped:
-        freq = result.get('Frequency_MHz', 0)
-        if freq > 0:  # Only positive frequencies are physically meaningful in RF
-            valid_results.append(result)
+            overlap_alerts.append(f"Tx({b2.code}) overlaps Rx({b1.code})")
+
+    signs = np.array([-1, 1])
+    unsigned = np.array([1])
+    mixing, coef_a, signed_b, per_pair = _mixing_table(bool(imd2), bool(imd4), bool(imd5), bool(imd7))
+
+    # Columnar (SoA) product buffers: family, band pair, edge indices, sign, frequency and
+    # generation order. Rows are only materialized as dicts after deduplication. Buffers
+    # are preallocated for the largest possible product count and filled by index, each
+    # in the narrowest dtype its values need (20 bytes per product).
+    capacity = 4*n*2 + n*n*per_pair + (n*n if aclr_margin > 0 else 0)
+    columns = {name: np.empty(capacity, dtype=dtype) for name, dtype in _PRODUCT_COLUMNS}
+    filled = 0
+
+    def add_products(family, freqs, mask, i, j, ei, ej, sign, order):
+        nonlocal filled
+        mask = np.broadcast_to(mask, freqs.shape)
+        end = filled + np.count_nonzero(mask)
+        columns["family"][filled:end] = np.broadcast_to(family, mask.shape)[mask]
+        for name, values in (("i", i), ("j", j), ("ei", ei), ("ej", ej), ("sign", sign), ("order", order)):
+            columns[name][filled:end] = np.broadcast_to(values, mask.shape)[mask]
+        columns["centi"][filled:end] = freqs[mask]
+        filled = end
+
+    def add_pair_family(product, freqs, mask):
+        """Record the (band i, band j, edge i, edge j, sign) grid of one _MixingProduct."""
+        sign_values = signs if product.signed else unsigned
+        i, j, a, e, s = np.ogrid[:n, :n, :2, :2, :len(sign_values)]
+        # Generation order of the original nested loops: pair, block, edges (the edge of
+        # band j first for swapped families), sub-product, sign
+        k1, k2 = (e, a) if product.swapped else (a, e)
+        order = np.ravel_multi_index((i, j, product.block, k1, k2, product.sub, s),
+                                     (n, n, _N_BLOCKS, 2, 2, _N_SUBS, 2))
+        add_products(_FAMILY_INDEX[product.family], freqs, mask, i, j, a, e, sign_values[s], order)
+
+    # Harmonics (2H, 3H, 4H, 5H) as one (order, band, edge) broadcast - Skip receive-only
+    # bands (tx_low = tx_high = 0)
+    b, e = np.ogrid[:n, :2]
+    add_products(_HARMONIC_FAMILIES[:, None, None], tx_c * _HARMONIC_ORDERS[:, None, None],
+                 has_tx[:, None] & nonzero_edge, b, -1, e, 0, 1, b*2 + e)
+
+    # Edge grids for every ordered band pair, trailing axis is the sign:
+    # A[i, j, a, b, s] is edge a of band i, B[i, j, a, b, s] is edge b of band j.
+    A = tx_c[:, None, :, None, None]
+    B = tx_c[None, :, None, :, None]
+    both_tx = (has_tx[:, None] & has_tx[None, :])[:, :, None, None, None]
+    both_edges = nonzero_edge[:, None, :, None, None] & nonzero_edge[None, :, None, :, None]
+    pair_valid = both_tx & ~np.eye(n, dtype=bool)[:, :, None, None, None]
+    upper = np.triu(np.ones((n, n), dtype=bool), 1)[:, :, None, None, None]
+    # Family masks are shared across the mixing table, so they are combined once up front
+    imd2_mask = both_tx & both_edges & upper
+    fund_a_mask = pair_valid & both_edges & upper
+    # 2B ± A of (j, i) is 2A ± B of (i, j) only where that one has non-zero edges
+    fund_b_mask = pair_valid & (upper | ~both_edges)
+    symmetric_mask = pair_valid & upper
+
+    # All enabled mixing products in one contraction F[k] = c_A·A + (s·c_B)·B
+    F = coef_a*A + signed_b*B
+    swap = (1, 0, 3, 2, 4)
+    for k, product in enumerate(mixing):
+        freqs = F[k] if product.signed else F[k][..., 1:]
+        if product.swapped:
+            freqs = freqs.transpose(swap)
+        if product.option == "imd2":
+            # IM2 beat terms (f₁ + f₂, f₁ - f₂, f₂ - f₁) over unordered pairs, positive only
+            mask = imd2_mask & (freqs > 0)
+        elif product.family == "IM3_fund_A":
+            mask = fund_a_mask
+        elif product.family == "IM3_fund_B":
+            mask = fund_b_mask
+        elif product.symmetric:
+            mask = symmetric_mask
         else:
-            invalid_count += 1
-    
+            mask = pair_valid
+        add_pair_family(product, freqs, mask)
+
+    # ACLR check (optional, for all pairs; skip receive-only bands, they do not transmit)
+    if aclr_margin > 0:
+        i, j = np.ogrid[:n, :n]
+        add_products(_FAMILY_INDEX["ACLR"], np.rint((tx_c[:, 1, None] + rx_c[None, :, 0]) / 2).astype(np.int32),
+                     has_tx[:, None] & ~np.eye(n, dtype=bool), i, j, 1, 0, 1, i*n + j)
+
+    family, prod_i, prod_j, edge_i, edge_j, sign, centi, order = (
+        columns[name][:filled] for name in ("family", "i", "j", "ei", "ej", "sign", "centi", "order")
+    )
+    type_code = _FAMILY_TYPE_CODE[family]
+    signal_priority = _FAMILY_SIGNAL_PRIORITY[family]
+    is_aclr = type_code == PRODUCT_TYPES.index("ACLR")
+
+    # Victim Rx windows hit by each product. ACLR rows compare one specific Tx/Rx pair.
+    scan_rows = np.flatnonzero(~is_aclr)
+    if n:
+        # Products outside the span of all Rx windows (typically high-order products of
+        # far-apart bands) cannot hit any victim: they are safe without a scan
+        in_span = (centi[scan_rows] >= rx_low_c.min()) & (centi[scan_rows] <= rx_high_c.max())
+        out_of_span, scan_rows = scan_rows[~in_span], scan_rows[in_span]
+    else:
+        out_of_span = scan_rows
+    hit_rows, hit_victims, safe = victim_hits(centi[scan_rows], rx_low_c, rx_high_c)
+    hit_rows = scan_rows[hit_rows]
+    safe_rows = np.concatenate([out_of_span, scan_rows[safe]])
+    if is_aclr.any():
+        aclr_rows = np.flatnonzero(is_aclr)
+        aclr_risk = aclr_check_vec(tx[prod_i[aclr_rows], 1], rx[prod_j[aclr_rows], 0], aclr_margin)
+        hit_rows = np.concatenate([hit_rows, aclr_rows[aclr_risk]])
+        hit_victims = np.concatenate([hit_victims, prod_j[aclr_rows[aclr_risk]]])
+        safe_rows = np.concatenate([safe_rows, aclr_rows[~aclr_risk]])
+
+    # Candidate rows: one per victim hit plus one safe row (victim -1) per product that
+    # misses at least one victim, in the generation order of the original loops.
+    cand_rows = np.concatenate([hit_rows, safe_rows])
+    cand_victims = np.concatenate([hit_victims, np.full(safe_rows.size, -1)])
+    cand_order = np.lexsort((cand_victims, order[cand_rows], type_code[cand_rows]))
+    cand_rows, cand_victims = cand_rows[cand_order], cand_victims[cand_order]
+
+    # Deduplicate: focus on mathematical uniqueness rather than descriptive differences.
+    # Same type + frequency + aggressor band(s) + victim = duplicate; aggressor pairs are
+    # unordered and bands are identified by code.
+    code_ids = {}
+    band_id = np.array([code_ids.setdefault(b.code, len(code_ids)) for b in selected_bands] + [-1])
+    n_ids = len(code_ids) + 1
+    # Canonical aggressor pair per (i, j), built once per pair rather than per row;
+    # column -1 stands for single-band products (harmonics, ACLR)
+    agg_j = np.where(_FAMILY_IS_PAIR[family], prod_j, -1)
+    pair_key = np.minimum.outer(band_id, band_id) + 1 + (np.maximum.outer(band_id, band_id) + 1) * n_ids
+    # Pack the whole key into one int64: type code, centi-MHz frequency, aggressor pair and
+    # victim band id, each shifted to start at 0
+    centi_min = int(centi.min()) if centi.size else 0
+    centi_span = int(centi.max()) - centi_min + 1 if centi.size else 1
+    key = np.ravel_multi_index(
+        (type_code[cand_rows], centi[cand_rows] - centi_min,
+         pair_key[prod_i[cand_rows], agg_j[cand_rows]], band_id[cand_victims] + 1),
+        (len(PRODUCT_TYPES), centi_span, n_ids * n_ids, n_ids),
+    )
+    # np.unique sorts stably, so return_index is the first occurrence of each key
+    _, first = np.unique(key, return_index=True)
+    keep = np.sort(first)
+    cand_rows, cand_victims = cand_rows[keep], cand_victims[keep]
+
+    # Filter out physically invalid frequencies (negative or zero) before rendering;
+    # only positive frequencies are physically meaningful in RF
+    valid = centi[cand_rows] > 0
+    invalid_count = int(np.count_nonzero(~valid))
+    cand_rows, cand_victims = cand_rows[valid], cand_victims[valid]
+    safe_count = 0
+    if not include_safe_rows:
+        risky = cand_victims >= 0
+        safe_count = int(np.count_nonzero(~risky))
+        cand_rows, cand_victims = cand_rows[risky], cand_victims[risky]
+
+    # Aggressors label per (i, j) pair, index -1 is the single-band label
+    aggressor_labels = [[f"{c1}, {c2}" for c2 in soa.codes] + [c1] for c1 in soa.codes]
+    frequency = centi / 100
+    family, prod_i, prod_j, agg_j, edge_i, edge_j, sign, frequency = (
+        x.tolist() for x in (family, prod_i, prod_j, agg_j, edge_i, edge_j, sign, frequency))
+    cand_rows, cand_victims = cand_rows.tolist(), cand_victims.tolist()
+    row_aggressors = [aggressor_labels[prod_i[row]][agg_j[row]] for row in cand_rows]
+
+    # Severity of the rows hitting a victim, all at once through the integer kernel
+    severity = np.zeros(len(cand_rows), dtype=int)
+    hit = [k for k, victim in enumerate(cand_victims) if victim >= 0]
+    if hit:
+        severity[hit] = _severity_levels(
+            [frequency[cand_rows[k]] for k in hit],
+            [soa.codes[cand_victims[k]] for k in hit],
+            [row_aggressors[k] for k in hit],
+            [_PRODUCT_FAMILIES[family[cand_rows[k]]][1] for k in hit],
+        )
+
+    # Band attributes are read once per band, not once per rendered row. Formula is a
+    # sort key, so it is the only text formatted before the rows are consumed.
+    band_fields = [_band_fields(b) for b in selected_bands]
+    formulas = [
+        _PRODUCT_FAMILIES[family[row]][3].format(**_template_fields(
+            family[row], prod_i[row], prod_j[row], edge_i[row], edge_j[row], sign[row], frequency[row], band_fields))
+        for row in cand_rows
+    ]
+
+    # Sort by severity (high to low; risk items first, then safe items), then by signal
+    # level priority, Formula and Frequency_MHz. Signal priority is one-to-one with Type,
+    # so Type needs no key of its own. lexsort is stable, ties keep generation order.
+    # Keys come from the columns; centi-MHz orders exactly like Frequency_MHz.
+    severity_priority = np.where(severity > 0, 6 - severity, 10)
+    ranking = np.lexsort((centi[cand_rows], np.array(formulas, dtype=str), signal_priority[cand_rows], severity_priority))
+    severity = severity.tolist()
+    valid_results = [
+        _render_row(family[row], prod_i[row], prod_j[row], edge_i[row], edge_j[row], sign[row], frequency[row],
+                    formulas[k], row_aggressors[k], cand_victims[k], severity[k], band_fields)
+        for k, row in ((k, cand_rows[k]) for k in ranking.tolist())
+    ]
+
     # Add note about filtered frequencies if any were removed
     if invalid_count > 0:
         overlap_alerts.append(f"Note: {invalid_count} products with invalid frequencies (≤ 0 MHz) were filtered out")
+    if safe_count > 0:
+        overlap_alerts.append(f"Note: {safe_count} safe products (no victim hit) were omitted")
     
     return valid_results, overlap_alerts
 
@@ -523,6 +438,83 @@ def aclr_check(tx_high: float, rx_low: float, margin: float) -> bool:
     # Adjacent channel leakage: Tx high within margin of Rx low
     return abs(tx_high - rx_low) <= margin
 
+def hits_rx_vec(freq_low, freq_high, rx_low, rx_high) -> np.ndarray:
+    """Array version of hits_rx; inputs broadcast against each other."""
+    freq_low, freq_high, rx_low, rx_high = (np.asarray(x) for x in (freq_low, freq_high, rx_low, rx_high))
+    return (
+        ((rx_low <= freq_low) & (freq_low <= rx_high))
+        | ((rx_low <= freq_high) & (freq_high <= rx_high))
+        | ((freq_low <= rx_low) & (freq_high >= rx_high))
+    )
+
+def aclr_check_vec(tx_high, rx_low, margin: float) -> np.ndarray:
+    """Array version of aclr_check; inputs broadcast against each other."""
+    return np.abs(np.asarray(tx_high) - np.asarray(rx_low)) <= margin
+
+def _intermod_combos(product_type: str, m: int, k: int, sign: int):
+    """
+    The four edge combos m·X ∓ k·Y / m·Y ∓ k·X of one intermodulation order as
+    (Type, Formula, c_X, X edge, c_Y, Y edge); edge 0 = low, 1 = high.
+    """
+    op = '+' if sign > 0 else '−'
+    km = '' if k == 1 else f"{k}·"
+    return (
+        (product_type, f"{m}·X_low {op} {km}Y_high", m, 0, sign*k, 1),
+        (product_type, f"{m}·X_high {op} {km}Y_low", m, 1, sign*k, 0),
+        (product_type, f"{m}·Y_low {op} {km}X_high", sign*k, 1, m, 0),
+        (product_type, f"{m}·Y_high {op} {km}X_low", sign*k, 0, m, 1),
+    )
+
+# Intermodulation combos of evaluate(), where X is the Tx band and Y the Tx edges of
+# the Rx band; freq = c_X·X + c_Y·Y. One generator for every order:
+# IM3: 2f1 − f2, IM4: 2f1 + 2f2, IM5: 3f1 − 2f2, IM7: 4f1 − 3f2
+_EVALUATE_COMBOS = (
+    _intermod_combos("IM3", 2, 1, -1)
+    + _intermod_combos("IM4", 2, 2, +1)
+    + _intermod_combos("IM5", 3, 2, -1)
+    + _intermod_combos("IM7", 4, 3, -1)
+)
+
+# Grid columns of evaluate() ahead of the combos: 2H..5H, then the 8 IM2 beats
+_EVALUATE_HARMONICS = np.array([2, 3, 4, 5])
+_EVALUATE_LEAD_TYPES = PRODUCT_TYPES[:4] + ("IM2",) * 8
+
+
+@lru_cache(maxsize=4096)
+def _lead_formula_labels(tx_code: str, rx_code: str) -> Tuple[str, ...]:
+    """Formula of the harmonic and IM2 grid columns of one (Tx, Rx) band pair."""
+    harmonics = tuple(f"{order}×Tx({tx_code})" for order in _EVALUATE_HARMONICS.tolist())
+    return harmonics + (f"Tx({tx_code}) + Tx({rx_code})", f"|Tx({tx_code}) - Tx({rx_code})|") * 4
+
+
+@lru_cache(maxsize=None)
+def _evaluate_combo_table(imd4: bool, imd5: bool, imd7: bool):
+    """
+    Enabled _EVALUATE_COMBOS as coefficient / edge arrays plus the per-column Type and
+    trailing Formula labels. Types are an object array of the shared label strings, so
+    indexing it hands every row the same str objects instead of fresh copies.
+    """
+    enabled = {"IM3": True, "IM4": imd4, "IM5": imd5, "IM7": imd7}
+    combos = [c for c in _EVALUATE_COMBOS if enabled[c[0]]]
+    c_x, x_edge, c_y, y_edge = (np.array([c[k] for c in combos], dtype=int) for k in range(2, 6))
+    column_types = np.array(_EVALUATE_LEAD_TYPES + tuple(c[0] for c in combos) + ("ACLR",), dtype=object)
+    tail_labels = tuple(c[1] for c in combos) + ("Tx_high vs Rx_low",)
+    return c_x, x_edge, c_y, y_edge, column_types, tail_labels
+
+def _product_envelope(X: np.ndarray, Y: np.ndarray, c_x: np.ndarray, c_y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Conservative [low, high] frequency bounds of every evaluate() product of each pair,
+    from the band edges and coefficient signs alone (no product grid is built).
+    """
+    x_lo, x_hi, y_lo, y_hi = X[:, :1], X[:, 1:], Y[:, :1], Y[:, 1:]
+    # c·v is smallest at the low edge for c > 0 and at the high edge for c < 0
+    combo_low = np.where(c_x > 0, c_x * x_lo, c_x * x_hi) + np.where(c_y > 0, c_y * y_lo, c_y * y_hi)
+    combo_high = np.where(c_x > 0, c_x * x_hi, c_x * x_lo) + np.where(c_y > 0, c_y * y_hi, c_y * y_lo)
+    low = np.concatenate([2 * x_lo, np.zeros_like(x_lo), combo_low], axis=1).min(axis=1)  # |f1 - f2| >= 0
+    high = np.concatenate([5 * x_hi, x_hi + y_hi, np.abs(x_hi - y_lo), np.abs(y_hi - x_lo), combo_high], axis=1).max(axis=1)
+    return low, high
+
+
 def evaluate(
     tx_band: Band,
     rx_band: Band,
@@ -530,179 +522,161 @@ def evaluate(
     imd4: bool = False,
     imd5: bool = True,
     imd7: bool = False,
-    aclr_margin: float = 0.0
+    aclr_margin: float = 0.0,
+    only_risks: bool = False,
+    min_level: Optional[str] = None
 ) -> List[Dict]:
+    columns = evaluate_columns([tx_band], [rx_band], guard, imd4, imd5, imd7, aclr_margin, only_risks, min_level)
+    del columns["Pair"]
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+def evaluate_columns(
+    tx_bands: List[Band],
+    rx_bands: List[Band],
+    guard: float,
+    imd4: bool = False,
+    imd5: bool = True,
+    imd7: bool = False,
+    aclr_margin: float = 0.0,
+    only_risks: bool = False,
+    min_level: Optional[str] = None
+) -> Dict[str, list]:
+    """
+    evaluate() rows of many (tx_band, rx_band) pairs as parallel column lists (Pair,
+    Type, Formula, Freq_low, Freq_high, Risk, RiskLevel), pair-major in evaluate() row
+    order; all products of all pairs are generated and scored in one broadcast. Pass
+    straight to pd.DataFrame() for a table.
+    With only_risks, rows without an Rx hit are dropped before any Formula is formatted;
+    with min_level ("High", "Med", "Low" or "Minimal"), so are rows whose RiskLevel is
+    below it.
+    """
+    n_pairs = len(tx_bands)
+    tx_soa, rx_soa = bands_to_soa(tx_bands), bands_to_soa(rx_bands)
+    X, Y = tx_soa.tx, rx_soa.tx
+    rx_edge = rx_soa.rx_low
+    rx_low = rx_edge - guard
+    rx_high = rx_soa.rx_high + guard
     # Skip calculations if tx_band is receive-only (like GNSS)
-    if tx_band.tx_low == 0 and tx_band.tx_high == 0:
-        return []
-        
-    rx_low, rx_high = rx_band.rx_low - guard, rx_band.rx_high + guard
-    rows = []
+    tx_active = (X != 0).any(axis=1)
 
     # 2H / 3H / 4H / 5H
-    for order in (2, 3, 4, 5):
-        low, high = tx_band.tx_low * order, tx_band.tx_high * order
-        rows.append(
-            dict(
-                Type=f"{order}H",
-                Formula=f"{order}×Tx({tx_band.code})",
-                Freq_low=low,
-                Freq_high=high,
-                Risk=hits_rx(low, high, rx_low, rx_high),
-                RiskLevel=risk_level(low, high, rx_low, rx_high),
-            )
-        )
+    harm_low, harm_high = X[:, :1] * _EVALUATE_HARMONICS, X[:, 1:] * _EVALUATE_HARMONICS
 
-    # IM2 Beat Terms (f1 ± f2) - Critical for wideband systems
-    # Only calculate if both bands have transmission capability
-    if not (tx_band.tx_low == 0 and tx_band.tx_high == 0) and not (rx_band.tx_low == 0 and rx_band.tx_high == 0):
-        tx_edges = [tx_band.tx_low, tx_band.tx_high]
-        rx_tx_edges = [rx_band.tx_low, rx_band.tx_high]
-        
-        for f1 in tx_edges:
-            for f2 in rx_tx_edges:
-                if f1 > 0 and f2 > 0:  # Ensure positive frequencies
-                    # f1 + f2
-                    freq_sum = f1 + f2
-                    rows.append(dict(
-                        Type="IM2",
-                        Formula=f"Tx({tx_band.code}) + Tx({rx_band.code})",
-                        Freq_low=freq_sum,
-                        Freq_high=freq_sum,
-                        Risk=rx_low <= freq_sum <= rx_high,
-                        RiskLevel=risk_level(freq_sum, freq_sum, rx_low, rx_high),
-                    ))
-                    
-                    # |f1 - f2| (absolute difference)
-                    freq_diff = abs(f1 - f2)
-                    if freq_diff > 0:  # Avoid zero frequency
-                        rows.append(dict(
-                            Type="IM2",
-                            Formula=f"|Tx({tx_band.code}) - Tx({rx_band.code})|",
-                            Freq_low=freq_diff,
-                            Freq_high=freq_diff,
-                            Risk=rx_low <= freq_diff <= rx_high,
-                            RiskLevel=risk_level(freq_diff, freq_diff, rx_low, rx_high),
-                        ))
-
-    # IM3: 2f1 ± f2 (use both band edges)
-    edges = [
-        (tx_band.tx_low, tx_band.tx_high),
-        (rx_band.tx_low, rx_band.tx_high),
-    ]
-    combos = [
-        (2 * edges[0][0] - edges[1][1], "2·X_low − Y_high"),
-        (2 * edges[0][1] - edges[1][0], "2·X_high − Y_low"),
-        (2 * edges[1][0] - edges[0][1], "2·Y_low − X_high"),
-        (2 * edges[1][1] - edges[0][0], "2·Y_high − X_low"),
-    ]
-    for freq, label in combos:
-        rows.append(
-            dict(
-                Type="IM3",
-                Formula=label,
-                Freq_low=freq,
-                Freq_high=freq,  # discrete
-                Risk=rx_low <= freq <= rx_high,
-                RiskLevel=risk_level(freq, freq, rx_low, rx_high),
-            )
-        )
+    # IM2 Beat Terms (f1 + f2, |f1 - f2|) - Critical for wideband systems, per pair
+    # [f1 edge, f2 edge, sum/diff]. Only calculated if both bands have transmission capability.
+    beats = np.stack([X[:, :, None] + Y[:, None, :], np.abs(X[:, :, None] - Y[:, None, :])], axis=-1)
+    # Ensure positive edges, and avoid a zero-frequency difference term
+    positive = (X[:, :, None] > 0) & (Y[:, None, :] > 0) & (Y != 0).any(axis=1)[:, None, None]
+    beat_valid = np.stack([positive, positive & (beats[..., 1] > 0)], axis=-1)
 
-    # IM4 (2f1+2f2)
-    if imd4:
-        combos4 = [
-            (2 * edges[0][0] + 2 * edges[1][1], "2·X_low + 2·Y_high"),
-            (2 * edges[0][1] + 2 * edges[1][0], "2·X_high + 2·Y_low"),
-            (2 * edges[1][0] + 2 * edges[0][1], "2·Y_low + 2·X_high"),
-            (2 * edges[1][1] + 2 * edges[0][0], "2·Y_high + 2·X_low"),
-        ]
-        for freq, label in combos4:
-            rows.append(
-                dict(
-                    Type="IM4",
-                    Formula=label,
-                    Freq_low=freq,
-                    Freq_high=freq,
-                    Risk=rx_low <= freq <= rx_high,
-                    RiskLevel=risk_level(freq, freq, rx_low, rx_high),
-                )
-            )
-    # IM5 (3f1±2f2)
-    if imd5:
-        combos5 = [
-            (3 * edges[0][0] - 2 * edges[1][1], "3·X_low − 2·Y_high"),
-            (3 * edges[0][1] - 2 * edges[1][0], "3·X_high − 2·Y_low"),
-            (3 * edges[1][0] - 2 * edges[0][1], "3·Y_low − 2·X_high"),
-            (3 * edges[1][1] - 2 * edges[0][0], "3·Y_high − 2·X_low"),
-        ]
-        for freq, label in combos5:
-            rows.append(
-                dict(
-                    Type="IM5",
-                    Formula=label,
-                    Freq_low=freq,
-                    Freq_high=freq,
-                    Risk=rx_low <= freq <= rx_high,
-                    RiskLevel=risk_level(freq, freq, rx_low, rx_high),
-                )
-            )
-    # IM7 (4f1±3f2)
-    if imd7:
-        combos7 = [
-            (4 * edges[0][0] - 3 * edges[1][1], "4·X_low − 3·Y_high"),
-            (4 * edges[0][1] - 3 * edges[1][0], "4·X_high − 3·Y_low"),
-            (4 * edges[1][0] - 3 * edges[0][1], "4·Y_low − 3·X_high"),
-            (4 * edges[1][1] - 3 * edges[0][0], "4·Y_high − 3·X_low"),
-        ]
-        for freq, label in combos7:
-            rows.append(
-                dict(
-                    Type="IM7",
-                    Formula=label,
-                    Freq_low=freq,
-                    Freq_high=freq,
-                    Risk=rx_low <= freq <= rx_high,
-                    RiskLevel=risk_level(freq, freq, rx_low, rx_high),
-                )
-            )
-    # ACLR check
-    if aclr_margin > 0:
-        aclr_risk = aclr_check(tx_band.tx_high, rx_band.rx_low, aclr_margin)
-        rows.append(
-            dict(
-                Type="ACLR",
-                Formula="Tx_high vs Rx_low",
-                Freq_low=tx_band.tx_high,
-                Freq_high=rx_band.rx_low,
-                Risk=aclr_risk,
-                RiskLevel="High" if aclr_risk else "Low",
-            )
-        )
-    return rows
+    # IM3: 2f1 ± f2, IM4: 2f1 + 2f2, IM5: 3f1 ± 2f2, IM7: 4f1 ± 3f2 (use both band edges)
+    c_x, x_edge, c_y, y_edge, column_types, tail_labels = _evaluate_combo_table(bool(imd4), bool(imd5), bool(imd7))
+    im_freqs = c_x * X[:, x_edge] + c_y * Y[:, y_edge]  # discrete
+
+    # ACLR check: Tx high edge against the unguarded Rx low edge, last column of every pair
+    aclr = aclr_margin > 0
+
+    max_level = _max_level_code(min_level)
+    filtered = only_risks or max_level < len(RISK_LEVELS) - 1
+    active = tx_active
+    if filtered:
+        # Pairs whose product envelope misses the guarded Rx window (widened by the
+        # distance bin of min_level), and that ACLR cannot flag, have no surviving row:
+        # they are never expanded or scored
+        reach = 0.0 if only_risks else RISK_DISTANCE_BINS[max_level - 1]
+        env_low, env_high = _product_envelope(X, Y, c_x, c_y)
+        reachable = (env_high >= rx_low - reach) & (env_low <= rx_high + reach)
+        if aclr:
+            # ACLR rows are High on a hit and Low otherwise
+            aclr_kept = not only_risks and max_level >= RISK_LEVELS.index("Low")
+            reachable |= aclr_kept | aclr_check_vec(X[:, 1], rx_edge, aclr_margin)
+        active = active & reachable
+    aclr_low, aclr_high = X[:, 1:], rx_edge[:, None]
+
+    # All rows of all pairs, pair-major in output order: harmonics, IM2, intermodulation, ACLR
+    freq_low = np.concatenate([harm_low, beats.reshape(n_pairs, 8), im_freqs, aclr_low], axis=1)
+    freq_high = np.concatenate([harm_high, beats.reshape(n_pairs, 8), im_freqs, aclr_high], axis=1)
+    valid = np.concatenate([np.ones((n_pairs, 4), dtype=bool), beat_valid.reshape(n_pairs, 8),
+                            np.ones((n_pairs, c_x.size), dtype=bool),
+                            np.full((n_pairs, 1), aclr)], axis=1) & active[:, None]
+    pair, column = np.nonzero(valid)
+    freq_low, freq_high = freq_low[valid], freq_high[valid]
+
+    if NUMBA_AVAILABLE:
+        # One compiled pass over the rows beats a dozen tiny-array ufunc calls per pair
+        risks, levels = evaluate_risks(freq_low, freq_high, rx_low[pair], rx_high[pair])
+    else:
+        risks = hits_rx_vec(freq_low, freq_high, rx_low[pair], rx_high[pair])
+        levels = _risk_level_codes(freq_low, freq_high, rx_low[pair], rx_high[pair])
+    if aclr:
+        is_aclr = column == valid.shape[1] - 1
+        risks[is_aclr] = aclr_check_vec(freq_low[is_aclr], freq_high[is_aclr], aclr_margin)
+        levels[is_aclr] = np.where(risks[is_aclr], RISK_LEVELS.index("High"), RISK_LEVELS.index("Low"))
+    if filtered:
+        keep = levels <= max_level
+        if only_risks:
+            keep &= risks
+        pair, column, freq_low, freq_high, risks, levels = (
+            x[keep] for x in (pair, column, freq_low, freq_high, risks, levels))
+
+    # Formula labels only for pairs with surviving rows; the band-code labels are interned
+    pair_labels = {p: _lead_formula_labels(tx_soa.codes[p], rx_soa.codes[p]) + tail_labels
+                   for p in np.unique(pair).tolist()}
+    pair, column = pair.tolist(), column.tolist()
+    return {
+        "Pair": pair,
+        "Type": column_types[column].tolist(),
+        "Formula": [pair_labels[p][c] for p, c in zip(pair, column)],
+        "Freq_low": freq_low.tolist(),
+        "Freq_high": freq_high.tolist(),
+        "Risk": risks.tolist(),
+        "RiskLevel": _RISK_LEVEL_OBJECTS[levels].tolist(),
+    }
 
 def risk_level(freq_low, freq_high, rx_low, rx_high):
     """Enhanced risk assessment with multiple criteria."""
-    # In-band interference (highest priority)
-    if rx_low <= freq_low <= rx_high or rx_low <= freq_high <= rx_high:
-        return "High"
-    
-    # Close proximity assessment
-    min_distance = min(
-        abs(freq_low - rx_low), 
-        abs(freq_low - rx_high),
-        abs(freq_high - rx_low), 
-        abs(freq_high - rx_high)
-    )
-    
-    # Adjacent channel interference
-    if min_distance < 1.0:  # Within 1 MHz
-        return "High"
-    elif min_distance < 5.0:  # Within 5 MHz
-        return "Med"
-    elif min_distance < 20.0:  # Within 20 MHz
-        return "Low"
-    else:
-        return "Minimal"
+    return RISK_LEVELS[risk_level_code(freq_low, freq_high, rx_low, rx_high)]
+
+# Risk level labels of risk_level_vec, indexed by level code: 0 = in band, 1-4 = distance bin
+RISK_LEVELS = ("High", "High", "Med", "Low", "Minimal")
+RISK_LEVEL_LABELS = np.array(RISK_LEVELS)
+# The same labels as shared str objects, for row-wise (list / dict) output
+_RISK_LEVEL_OBJECTS = np.array(RISK_LEVELS, dtype=object)
+
+def _max_level_code(min_level: Optional[str]) -> int:
+    """Largest level code (RISK_LEVELS index) at or above min_level; None keeps every level."""
+    if min_level is None:
+        return len(RISK_LEVELS) - 1
+    if min_level not in RISK_LEVELS:
+        raise ValueError(f"min_level must be one of {', '.join(dict.fromkeys(RISK_LEVELS))}, got {min_level!r}")
+    return len(RISK_LEVELS) - 1 - RISK_LEVELS[::-1].index(min_level)
+
+def risk_level_vec(freq_low, freq_high, rx_low, rx_high) -> np.ndarray:
+    """Array version of risk_level; inputs broadcast against each other."""
+    return RISK_LEVEL_LABELS[_risk_level_codes(freq_low, freq_high, rx_low, rx_high)]
+
+def _risk_level_codes(freq_low, freq_high, rx_low, rx_high) -> np.ndarray:
+    """risk_level_vec as level codes (indices into RISK_LEVELS)."""
+    freq_low, freq_high, rx_low, rx_high = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (freq_low, freq_high, rx_low, rx_high)))
+    in_band = ((rx_low <= freq_low) & (freq_low <= rx_high)) | ((rx_low <= freq_high) & (freq_high <= rx_high))
+    min_distance = np.minimum.reduce([
+        np.abs(freq_low - rx_low),
+        np.abs(freq_low - rx_high),
+        np.abs(freq_high - rx_low),
+        np.abs(freq_high - rx_high),
+    ])
+    # Distance bin without a branch ladder: side='right' keeps each bin edge exclusive
+    return np.where(in_band, 0, np.searchsorted(RISK_DISTANCE_BINS, min_distance, side='right') + 1)
+
+
+def results_to_columns(results: List[Dict]) -> Dict[str, list]:
+    """
+    Column lists of uniform result dicts (keys of the first row), so a table is built
+    with one columnar pd.DataFrame() call instead of parsing every row dict.
+    """
+    if not results:
+        return {}
+    return {key: [row.get(key) for row in results] for key in results[0]}
 
 
 def validate_band_configuration(selected_bands: List[Band]) -> List[str]:
@@ -747,100 +721,164 @@ def validate_band_configuration(selected_bands: List[Band]) -> List[str]:
     return warnings
 
 
-def assess_risk_severity(frequency: float, victim_code: str, aggressors: str, product_type: str) -> Tuple[str, int]:
-    """
-    Assess risk severity based on frequency, victim, and interference type.
-    Returns (risk_symbol, severity_level) where severity_level is 1-5 (5 = most critical).
-    """
-    # Critical frequency bands for different services
-    critical_bands = {
-        # GPS/GNSS (high precision navigation)
-        'GNSS_L1': (1575.0, 1576.0, 5),  # Primary GPS frequency
-        'GNSS_L2': (1227.0, 1228.0, 5),  # GPS L2 frequency
-        'GNSS_L5': (1176.0, 1177.0, 4),  # GPS L5 frequency
-        
-        # ISM bands (unlicensed, high interference potential)
-        'ISM_24': (2400.0, 2500.0, 4),   # 2.4 GHz ISM (BLE, Wi-Fi, etc.)
-        'ISM_58': (5725.0, 5875.0, 3),   # 5.8 GHz ISM
-        
-        # Public Safety (critical communications)
-        'FirstNet': (758.0, 768.0, 5),   # FirstNet uplink
-        'PublicSafety': (763.0, 775.0, 5), # Public safety bands
-        
-        # Cellular uplinks (interference affects base stations)
-        'Cellular_UL': (824.0, 894.0, 4), # Cellular uplinks (affects towers)
-        
-        # Wi-Fi (common coexistence issues)
-        'WiFi_24': (2400.0, 2495.0, 4),  # Wi-Fi 2.4 GHz
-        'WiFi_5': (5150.0, 5925.0, 3),   # Wi-Fi 5/6 GHz
-        
-        # BLE (sensitive to interference)
-        'BLE': (2402.0, 2480.0, 4),      # Bluetooth Low Energy
-    }
-    
-    # Base severity assessment
-    severity = 1  # Default low risk
-    risk_symbol = "⚠️"
-    
-    # Assess victim criticality
-    victim_criticality = {
-        'GNSS_L1': 5, 'GNSS_L2': 5, 'GNSS_L5': 4,  # GPS is critical
-        'LTE_B13': 5, 'LTE_B14': 5,  # Public safety LTE bands
-        'BLE': 4,     # BLE sensitive to interference
-        'WiFi_2G': 4, # Wi-Fi 2.4G high usage
-        'WiFi_5G': 3, # Wi-Fi 5G less congested
-        'HaLow_NA': 3, # Wi-Fi HaLow growing importance
-    }
+# Critical frequency bands for different services: (low, high, severity), checked in order
+CRITICAL_BANDS = {
+    # GPS/GNSS (high precision navigation)
+    'GNSS_L1': (1575.0, 1576.0, 5),  # Primary GPS frequency
+    'GNSS_L2': (1227.0, 1228.0, 5),  # GPS L2 frequency
+    'GNSS_L5': (1176.0, 1177.0, 4),  # GPS L5 frequency
     
-    # Get victim base severity
-    for victim_pattern, crit_level in victim_criticality.items():
-        if victim_pattern in victim_code:
-            severity = max(severity, crit_level)
-            break
+    # ISM bands (unlicensed, high interference potential)
+    'ISM_24': (2400.0, 2500.0, 4),   # 2.4 GHz ISM (BLE, Wi-Fi, etc.)
+    'ISM_58': (5725.0, 5875.0, 3),   # 5.8 GHz ISM
     
-    # Check if frequency falls in critical bands
-    for band_name, (low, high, band_severity) in critical_bands.items():
-        if low <= frequency <= high:
-            severity = max(severity, band_severity)
-            # Special case: GPS interference is always critical
-            if 'GNSS' in band_name:
-                severity = 5
-            break
+    # Public Safety (critical communications)
+    'FirstNet': (758.0, 768.0, 5),   # FirstNet uplink
+    'PublicSafety': (763.0, 775.0, 5), # Public safety bands
     
-    # Product type severity modifiers
-    if product_type == '3H':  # 3rd harmonics are typically stronger
-        severity = min(severity + 1, 5)
-    elif product_type == '2H':  # 2nd harmonics are very strong
-        severity = min(severity + 1, 5)
-    elif product_type == 'IM2':  # IM2 products are often strong
-        severity = min(severity + 1, 5)
-    elif product_type in ['IM4', 'IM5', 'IM7']:  # Higher order typically weaker
-        severity = max(severity - 1, 1)
+    # Cellular uplinks (interference affects base stations)
+    'Cellular_UL': (824.0, 894.0, 4), # Cellular uplinks (affects towers)
     
-    # Aggressor analysis - multiple aggressors increase risk
-    if ',' in aggressors or ' and ' in aggressors.lower():
-        severity = min(severity + 1, 5)  # Multiple aggressors = higher risk
+    # Wi-Fi (common coexistence issues)
+    'WiFi_24': (2400.0, 2495.0, 4),  # Wi-Fi 2.4 GHz
+    'WiFi_5': (5150.0, 5925.0, 3),   # Wi-Fi 5/6 GHz
     
-    # Special cases for NA Case 1 analysis
-    if 'LTE_B13' in aggressors or 'LTE_B14' in aggressors:
-        # Public safety bands as aggressors are critical
-        severity = min(severity + 1, 5)
-    
-    if 'BLE' in victim_code and 'WiFi' in aggressors:
-        # BLE-WiFi coexistence is critical in ISM band
-        if 2400 <= frequency <= 2500:
-            severity = 5  # Maximum severity for ISM band interference
-    
-    # Determine risk symbol based on severity
-    if severity >= 5:
-        risk_symbol = "🔴"  # Critical - Red circle
-    elif severity >= 4:
-        risk_symbol = "🟠"  # High - Orange circle  
-    elif severity >= 3:
-        risk_symbol = "🟡"  # Medium - Yellow circle
-    elif severity >= 2:
-        risk_symbol = "🔵"  # Low - Blue circle
-    else:
-        risk_symbol = "✅"  # Very Low/Safe - Green check
-    
-    return risk_symbol, severity
+    # BLE (sensitive to interference)
+    'BLE': (2402.0, 2480.0, 4),      # Bluetooth Low Energy
+}
+
+# Victim criticality by band code pattern, first match wins
+VICTIM_CRITICALITY = {
+    'GNSS_L1': 5, 'GNSS_L2': 5, 'GNSS_L5': 4,  # GPS is critical
+    'LTE_B13': 5, 'LTE_B14': 5,  # Public safety LTE bands
+    'BLE': 4,     # BLE sensitive to interference
+    'WiFi_2G': 4, # Wi-Fi 2.4G high usage
+    'WiFi_5G': 3, # Wi-Fi 5G less congested
+    'HaLow_NA': 3, # Wi-Fi HaLow growing importance
+}
+
+# Product type severity modifiers: harmonics and IM2 are strong, higher orders weaker
+PRODUCT_TYPE_MODIFIER = {'2H': 1, '3H': 1, 'IM2': 1, 'IM4': -1, 'IM5': -1, 'IM7': -1}
+
+# Risk symbol by severity level
+RISK_SYMBOLS = (
+    "✅",  # 0: safe
+    "✅",  # 1: Very Low/Safe - Green check
+    "🔵",  # 2: Low - Blue circle
+    "🟡",  # 3: Medium - Yellow circle
+    "🟠",  # 4: High - Orange circle
+    "🔴",  # 5: Critical - Red circle
+)
+
+_CRIT_LOW = np.array([low for low, _, _ in CRITICAL_BANDS.values()])
+_CRIT_HIGH = np.array([high for _, high, _ in CRITICAL_BANDS.values()])
+_CRIT_SEVERITY = np.array([sev for _, _, sev in CRITICAL_BANDS.values()])
+_CRIT_GNSS = np.array(['GNSS' in name for name in CRITICAL_BANDS])
+
+
+def _critical_regions():
+    """
+    Resolve the overlapping critical bands into a sorted lookup table. The distinct band
+    edges split the axis into 2m+1 regions (below, each edge point, each gap between
+    edges, above); every region gets the severity and GNSS flag of the first critical
+    band containing it, as the linear scan in CRITICAL_BANDS order would pick.
+    """
+    edges = np.unique(np.concatenate([_CRIT_LOW, _CRIT_HIGH]))
+    probes = np.empty(2 * edges.size + 1)
+    probes[0], probes[-1] = edges[0] - 1.0, edges[-1] + 1.0
+    probes[1::2] = edges
+    probes[2:-1:2] = (edges[:-1] + edges[1:]) / 2
+    inside = (_CRIT_LOW <= probes[:, None]) & (probes[:, None] <= _CRIT_HIGH)
+    first, hit = inside.argmax(axis=1), inside.any(axis=1)
+    return edges, np.where(hit, _CRIT_SEVERITY[first], 0), hit & _CRIT_GNSS[first]
+
+_CRIT_EDGES, _CRIT_REGION_SEVERITY, _CRIT_REGION_GNSS = _critical_regions()
+
+
+# BLE victims with a Wi-Fi aggressor are always critical inside the 2.4 GHz band
+_BLE_WIFI_WINDOW = (2400, 2500)
+
+
+def _critical_region(frequency):
+    """Index into the _critical_regions() table of each frequency."""
+    return np.searchsorted(_CRIT_EDGES, frequency, side='left') + np.searchsorted(_CRIT_EDGES, frequency, side='right')
+
+
+def _critical_band_lookup(frequency):
+    """(severity, GNSS flag) of the critical band containing each frequency; severity 0 if none."""
+    region = _critical_region(frequency)
+    return _CRIT_REGION_SEVERITY[region], _CRIT_REGION_GNSS[region]
+
+
+# One alternation over the victim patterns (band codes never contain two of them)
+_VICTIM_PATTERN = re.compile('|'.join(map(re.escape, VICTIM_CRITICALITY)))
+_PUBLIC_SAFETY_PATTERN = re.compile(r'LTE_B1[34]')
+_MULTI_AGGRESSOR_PATTERN = re.compile(r',| and ', re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def _victim_features(victim_code: str) -> Tuple[int, bool]:
+    """(criticality level of the matching pattern or 0, BLE victim)."""
+    match = _VICTIM_PATTERN.search(victim_code)
+    return VICTIM_CRITICALITY[match.group(0)] if match else 0, 'BLE' in victim_code
+
+
+@lru_cache(maxsize=None)
+def _aggressor_features(aggressors: str) -> Tuple[bool, bool, bool]:
+    """(multiple aggressors, public safety aggressor, Wi-Fi aggressor)."""
+    return (
+        _MULTI_AGGRESSOR_PATTERN.search(aggressors) is not None,
+        _PUBLIC_SAFETY_PATTERN.search(aggressors) is not None,
+        'WiFi' in aggressors,
+    )
+
+
+def _severity_levels(frequency, victim_codes: List[str], aggressors: List[str], product_types: List[str]) -> np.ndarray:
+    """Severity of many rows at once through the integer severity kernel."""
+    victim = [_victim_features(code) for code in victim_codes]
+    aggressor = [_aggressor_features(label) for label in aggressors]
+    multi, public_safety, wifi = (np.array([flags[k] for flags in aggressor], dtype=bool) for k in range(3))
+    frequency = np.asarray(frequency, dtype=float)
+    crit_severity, crit_gnss = _critical_band_lookup(frequency)
+    return severity_levels(
+        (_BLE_WIFI_WINDOW[0] <= frequency) & (frequency <= _BLE_WIFI_WINDOW[1]),
+        np.array([level for level, _ in victim], dtype=np.int64),
+        np.array([is_ble for _, is_ble in victim], dtype=bool),
+        np.array([PRODUCT_TYPE_MODIFIER.get(t, 0) for t in product_types], dtype=np.int64),
+        multi, public_safety, wifi, crit_severity, crit_gnss,
+    )
+
+
+def assess_severity_level(frequency: float, victim_code: str, aggressors: str, product_type: str) -> int:
+    """
+    Integer core of assess_risk_severity: severity level 1-5 (5 = most critical).
+    Map to a symbol with risk_symbol() only where the result is displayed.
+    """
+    # Severity only depends on the frequency through its critical band region and the
+    # BLE/Wi-Fi window, so the memo is keyed on those instead of the raw frequency
+    frequency = float(frequency)
+    ble_window = _BLE_WIFI_WINDOW[0] <= frequency <= _BLE_WIFI_WINDOW[1]
+    return _assess_region_severity(int(_critical_region(frequency)), ble_window, victim_code, aggressors, product_type)
+
+
+@lru_cache(maxsize=65536)
+def _assess_region_severity(region: int, ble_window: bool, victim_code: str, aggressors: str, product_type: str) -> int:
+    victim_level, victim_is_ble = _victim_features(victim_code)
+    return int(severity_level(
+        ble_window, victim_level, victim_is_ble, PRODUCT_TYPE_MODIFIER.get(product_type, 0),
+        *_aggressor_features(aggressors), int(_CRIT_REGION_SEVERITY[region]), bool(_CRIT_REGION_GNSS[region]),
+    ))
+
+
+def risk_symbol(severity: int) -> str:
+    """Display symbol of a severity level (0 = safe row)."""
+    return RISK_SYMBOLS[severity]
+
+
+def assess_risk_severity(frequency: float, victim_code: str, aggressors: str, product_type: str) -> Tuple[str, int]:
+    """
+    Assess risk severity based on frequency, victim, and interference type.
+    Returns (risk_symbol, severity_level) where severity_level is 1-5 (5 = most critical).
+    """
+    severity = assess_severity_level(frequency, victim_code, aggressors, product_type)
+    return risk_symbol(severity), severity
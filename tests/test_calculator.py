@@ -0,0 +1,82 @@
+"""
+Regression checks of calculate_all_products and evaluate against the output of the
+original loop-based implementation (tests/data/baseline_products.json and
+tests/data/baseline_evaluate.json).
+
+Run from the repository root: python -m unittest discover tests
+"""
+import json
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bands import Band, BANDS  # noqa: E402
+from calculator import calculate_all_products, evaluate  # noqa: E402
+
+with open(os.path.join(ROOT, "tests", "data", "baseline_products.json"), encoding="utf-8") as f:
+    BASELINE = json.load(f)
+with open(os.path.join(ROOT, "tests", "data", "baseline_evaluate.json"), encoding="utf-8") as f:
+    EVALUATE_BASELINE = json.load(f)
+
+
+class CalculateAllProductsTest(unittest.TestCase):
+    def test_matches_baseline(self):
+        for case in BASELINE:
+            with self.subTest(bands=case["bands"]):
+                results, alerts = calculate_all_products([BANDS[c] for c in case["bands"]], **case["options"])
+                self.assertEqual(results, case["results"])
+                self.assertEqual(alerts, case["alerts"])
+
+    def test_product_on_rx_edge_is_a_hit(self):
+        # 3×13.56 - 2×13.56 lands exactly on the 13.56 MHz RFID_HF and NFC windows.
+        # Float arithmetic gave 13.560000000000002 and reported it safe; the
+        # fixed-point (centi-MHz) arithmetic reports both hits.
+        bands = [BANDS[c] for c in ("RFID_HF", "NFC", "HaLow_JP", "LTE_B12")]
+        results, _ = calculate_all_products(bands, guard=0.0, imd2=True, imd4=True, imd5=True, imd7=True, aclr_margin=5.0)
+        rows = [r for r in results if r["Formula"] == "3×RFID_HF_low - 2×NFC_low"]
+        self.assertEqual([(r["Frequency_MHz"], r["Victims"]) for r in rows if r["Severity"] > 0], [(13.56, "RFID_HF"), (13.56, "NFC")])
+
+
+class EvaluateTest(unittest.TestCase):
+    # Band pairs with in-band, near and far products, ACLR hits, a receive-only Tx, and
+    # low Tx bands (RFID_HF, Amateur_2M) whose products all fall far from GNSS / LTE_B29
+    FILTER_BANDS = ("LTE_B12", "LTE_B13", "LTE_B17", "LTE_B29", "LTE_B7", "LTE_B38", "LTE_B41",
+                    "WiFi_2G", "BLE", "HaLow_JP", "HaLow_KR", "RFID_HF", "Amateur_2M", "GNSS_L1")
+
+    def test_matches_baseline(self):
+        for case in EVALUATE_BASELINE:
+            with self.subTest(tx=case["tx"], rx=case["rx"]):
+                self.assertEqual(evaluate(BANDS[case["tx"]], BANDS[case["rx"]], **case["options"]), case["results"])
+
+    def test_filters_match_filtered_output(self):
+        # only_risks / min_level prune before the rows are built; the result must be the
+        # unfiltered rows filtered afterwards, in the same order
+        ranks = {level: rank for rank, level in enumerate(("High", "Med", "Low", "Minimal"))}
+        pairs = [(BANDS[tx], BANDS[rx]) for tx in self.FILTER_BANDS for rx in self.FILTER_BANDS]
+        # Every product of a 100 MHz tone is a multiple of 100 MHz: the nearest one (500)
+        # is Med (2 MHz) from the first guarded window and Low (14 MHz) from the second
+        tone = Band("TONE_100", 100, 100, 100, 100, "100 MHz tone", "Test")
+        pairs += [(tone, Band("RX_503", 0, 0, 503, 510, "503-510 MHz", "Test")),
+                  (tone, Band("RX_515", 0, 0, 515, 530, "515-530 MHz", "Test"))]
+        for tx, rx in pairs:
+            for aclr_margin in (0.0, 5.0):
+                rows = evaluate(tx, rx, 1.0, imd4=True, imd7=True, aclr_margin=aclr_margin)
+                for only_risks in (False, True):
+                    for min_level in (None, *ranks):
+                        with self.subTest(tx=tx.code, rx=rx.code, aclr_margin=aclr_margin, only_risks=only_risks, min_level=min_level):
+                            expected = [r for r in rows
+                                        if (r["Risk"] or not only_risks)
+                                        and (min_level is None or ranks[r["RiskLevel"]] <= ranks[min_level])]
+                            self.assertEqual(evaluate(tx, rx, 1.0, imd4=True, imd7=True, aclr_margin=aclr_margin,
+                                                      only_risks=only_risks, min_level=min_level), expected)
+
+    def test_unknown_min_level_raises(self):
+        with self.assertRaises(ValueError):
+            evaluate(BANDS["LTE_B13"], BANDS["GNSS_L1"], 0.0, min_level="Critical")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Parity checks of the optional numba kernels in _kernels.py against their NumPy /
+serial counterparts and a brute-force scan. The numba tests are skipped when numba
+is not installed.
+
+Run from the repository root: python -m unittest discover tests
+"""
+import os
+import sys
+import unittest
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import _kernels  # noqa: E402
+from _kernels import NUMBA_AVAILABLE, _sorted_windows, _victim_hits_numpy, _evaluate_risks_serial  # noqa: E402
+
+
+def _windows(rng, n, dtype):
+    """Random Rx windows with overlapping, nested, duplicate and zero-width entries."""
+    low = rng.integers(0, 2000, n)
+    high = low + rng.integers(0, 200, n)
+    high[::5] = low[::5]  # zero-width (single frequency) windows
+    low[1::7], high[1::7] = low[0], high[0]  # duplicates of the first window
+    return low.astype(dtype), high.astype(dtype)
+
+
+def _frequencies(rng, n, rx_low, rx_high, dtype):
+    """Random frequencies plus every window edge, so edge hits are always covered."""
+    freq = np.concatenate([rng.integers(-50, 2300, n), rx_low, rx_high, rx_low - 1, rx_high + 1])
+    return freq.astype(dtype)
+
+
+def _brute_force_hits(freq, rx_low, rx_high):
+    mask = (rx_low[None, :] <= freq[:, None]) & (freq[:, None] <= rx_high[None, :])
+    rows, victims = np.nonzero(mask)
+    return rows, victims, ~mask.all(axis=1)
+
+
+class VictimHitsTest(unittest.TestCase):
+    CASES = [(n_rx, dtype) for n_rx in (1, 2, 13, 60) for dtype in (np.int32, np.float64)]
+
+    def assertHitsEqual(self, actual, expected):
+        for a, e in zip(actual, expected):
+            np.testing.assert_array_equal(a, e)
+
+    def test_numpy_matches_brute_force(self):
+        rng = np.random.default_rng(1)
+        for n_rx, dtype in self.CASES:
+            with self.subTest(n_rx=n_rx, dtype=dtype.__name__):
+                rx_low, rx_high = _windows(rng, n_rx, dtype)
+                freq = _frequencies(rng, 500, rx_low, rx_high, dtype)
+                self.assertHitsEqual(_victim_hits_numpy(freq, rx_low, rx_high), _brute_force_hits(freq, rx_low, rx_high))
+
+    @unittest.skipUnless(NUMBA_AVAILABLE, "numba is not installed")
+    def test_numba_matches_numpy_and_brute_force(self):
+        rng = np.random.default_rng(2)
+        for n_rx, dtype in self.CASES:
+            with self.subTest(n_rx=n_rx, dtype=dtype.__name__):
+                rx_low, rx_high = _windows(rng, n_rx, dtype)
+                freq = _frequencies(rng, 500, rx_low, rx_high, dtype)
+                order, high_sorted, first, last = _sorted_windows(freq, rx_low, rx_high)
+                hits = _kernels._victim_hits_numba(freq, order, high_sorted, first, last, rx_low.size)
+                self.assertHitsEqual(hits, _victim_hits_numpy(freq, rx_low, rx_high))
+                self.assertHitsEqual(hits, _brute_force_hits(freq, rx_low, rx_high))
+
+
+class EvaluateRisksTest(unittest.TestCase):
+    @unittest.skipUnless(NUMBA_AVAILABLE, "numba is not installed")
+    def test_parallel_matches_serial(self):
+        rng = np.random.default_rng(3)
+        n_rows = 20_000
+        rx_low = rng.integers(0, 2000, n_rows).astype(float)
+        rx_high = rx_low + rng.integers(0, 50, n_rows)
+        # Points and ranges around the windows, including edges and each distance bin boundary
+        freq_low = rx_low + rng.choice([-25.0, -20.0, -5.0, -1.0, -0.5, 0.0, 3.0], n_rows)
+        freq_high = freq_low + rng.choice([0.0, 0.0, 2.0, 100.0], n_rows)
+        risks, levels = _kernels._evaluate_risks_parallel(freq_low, freq_high, rx_low, rx_high)
+        expected_risks, expected_levels = _evaluate_risks_serial(freq_low, freq_high, rx_low, rx_high)
+        np.testing.assert_array_equal(risks, expected_risks)
+        np.testing.assert_array_equal(levels, expected_levels)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,7 @@ import streamlit as st
 import tempfile
 import pandas as pd
 from bands import BANDS, Band
-from calculator import calculate_all_products, validate_band_configuration
+from calculator import calculate_all_products, results_to_columns, validate_band_configuration
 import altair as alt
 from io import BytesIO
 
@@ -604,7 +604,7 @@ if st.button("🚀 Calculate Interference", type=calc_button_type, use_container
                             
                             # Filter LTE harmonic products and specific IM products
                             if (product_type in ['2H', '3H'] and 'LTE_' in aggressors) or \
-                               (product_type == 'IM3' and 'LTE_' in aggressors and result.get('Risk') == '⚠️'):
+                               (product_type == 'IM3' and 'LTE_' in aggressors and result.get('Severity', 0) > 0):
                                 should_filter = True
                                 wci2_filtered_count += 1
                         
@@ -625,7 +625,7 @@ if st.button("🚀 Calculate Interference", type=calc_button_type, use_container
                             filter_msg += ")"
                         st.info(filter_msg)
                 
-                results = pd.DataFrame(results_list)
+                results = pd.DataFrame(results_to_columns(results_list))
                 
                 if results.empty:
                     st.warning("No interference products found with current settings.")
@@ -850,7 +850,7 @@ if st.button("🚀 Calculate Interference", type=calc_button_type, use_container
             # Filter results for export if requested
             export_results = results.copy()
             if not include_safe:
-                export_results = export_results[export_results['Risk'] == '⚠️'] if 'Risk' in export_results.columns else export_results
+                export_results = export_results[export_results['Severity'] > 0] if 'Severity' in export_results.columns else export_results
                 st.info(f"Export filtered to {len(export_results)} risk products (safe products excluded)")
             
             col1, col2, col3 = st.columns(3)
@@ -1010,7 +1010,7 @@ if st.button("🚀 Calculate Interference", type=calc_button_type, use_container
                             
                             # Color code risk rows
                             for i, (_, row) in enumerate(pdf_results.iterrows(), 1):
-                                if 'Risk' in row and row['Risk'] == '⚠️':
+                                if 'Severity' in row and row['Severity'] > 0:
                                     table_style.append(('BACKGROUND', (0, i), (-1, i), colors.mistyrose))
                                 else:
                                     table_style.append(('BACKGROUND', (0, i), (-1, i), colors.lightcyan))